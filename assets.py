@@ -0,0 +1,97 @@
+import os  # used for finding the asset files
+import time  # used for measuring the load times of the assets
+import threading  # used for loading the assets on a background thread as well
+from lib.picture import Picture  # used for loading the images
+import pygame as pg  # used for loading the sounds and the musics
+
+# A class for modeling a registry of the images, the sounds and the musics used
+# by the game. The paths of the files are resolved once and each asset is loaded
+# from its file only when it is used for the first time, then it is kept in
+# memory and shared by all the menus and the games.
+class AssetManager:
+   # A constructor for creating an asset manager for the files in the given
+   # directory (in the directory of this python code file by default)
+   def __init__(self, base_dir=None):
+      if base_dir is None:
+         base_dir = os.path.dirname(os.path.realpath(__file__))
+      self.base_dir = base_dir
+      # the absolute paths of the files by their relative paths
+      self.paths = {}
+      # the loaded pictures and sounds by their relative paths
+      self.pictures, self.sounds = {}, {}
+      # the relative path of the music loaded onto the mixer (None if no music
+      # is loaded)
+      self.loaded_music = None
+      # the time spent for loading each asset (in milliseconds)
+      self.load_times = {}
+      # the lock that is held while the mixer is initialized or a sound or a
+      # music is loaded (they may be loaded on a background thread at startup)
+      self.lock = threading.RLock()
+
+   # A method that returns the absolute path of the file with the given path
+   # relative to the base directory
+   def get_path(self, name):
+      path = self.paths.get(name)
+      if path is None:
+         path = self.paths[name] = os.path.join(self.base_dir, name)
+      return path
+
+   # A method that returns the picture loaded from the image file with the
+   # given relative path, converted to the pixel format of the display window
+   def get_picture(self, name):
+      picture = self.pictures.get(name)
+      if picture is None:
+         start_time = time.perf_counter()
+         picture = Picture(self.get_path(name))
+         picture.convert()
+         self.pictures[name] = picture
+         self.record_load_time(name, start_time)
+      return picture
+
+   # A method for initializing the mixer of pygame (only once)
+   def init_mixer(self):
+      with self.lock:
+         if pg.mixer.get_init() is None:
+            start_time = time.perf_counter()
+            pg.mixer.init()
+            self.record_load_time("mixer", start_time)
+
+   # A method that returns the sound loaded from the sound file with the given
+   # relative path (decoded once and played as many times as needed)
+   def get_sound(self, name):
+      with self.lock:
+         sound = self.sounds.get(name)
+         if sound is None:
+            self.init_mixer()
+            start_time = time.perf_counter()
+            sound = self.sounds[name] = pg.mixer.Sound(self.get_path(name))
+            self.record_load_time(name, start_time)
+         return sound
+
+   # A method for loading the music with the given relative path onto the
+   # mixer (musics are streamed from their files, so the music is loaded again
+   # only when another music is loaded after it)
+   def load_music(self, name):
+      with self.lock:
+         self.init_mixer()
+         if name != self.loaded_music:
+            start_time = time.perf_counter()
+            pg.mixer.music.load(self.get_path(name))
+            self.loaded_music = name
+            self.record_load_time(name, start_time)
+
+   # A method for recording the time passed since the given start time as the
+   # load time of the asset with the given name
+   def record_load_time(self, name, start_time):
+      self.load_times[name] = self.load_times.get(name, 0) + (time.perf_counter() - start_time) * 1000
+
+   # A method that returns a report of the load times of the assets (the
+   # slowest asset first)
+   def get_load_report(self):
+      lines = ["%8.2f ms  %s" % (msec, name) for name, msec in
+               sorted(self.load_times.items(), key=lambda item: -item[1])]
+      lines.append("%8.2f ms  total" % sum(self.load_times.values()))
+      return "\n".join(lines)
+
+# the asset manager shared by all the modules of the game
+assets = AssetManager()
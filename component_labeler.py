@@ -0,0 +1,98 @@
+import numpy as np  # fundamental Python module for scientific computing
+
+# A class for labeling the connected components (4-connectivity) of the tiles
+# on the game grid by using a union-find structure with path compression
+class ComponentLabeler:
+   # A constructor for creating a labeler for a game grid with the given size
+   def __init__(self, grid_h, grid_w):
+      self.grid_height = grid_h
+      self.grid_width = grid_w
+      # the occupancy mask, the labels and the number of labels computed by
+      # the last labeling (reused by the incremental mode)
+      self.mask = np.zeros((grid_h, grid_w), dtype=bool)
+      self.labels = np.zeros((grid_h, grid_w), dtype=int)
+      self.num_labels = 0
+      # provisional labels assigned by the raster scan to each cell of the
+      # flattened grid (0 represents an empty cell)
+      self.provisional = [0] * (grid_h * grid_w)
+      # union-find parent of each provisional label (label 0 is the background)
+      self.parent = [0]
+      # the union-find parents before scanning each row, so that the scan can
+      # restart from any row by restoring the state of the rows below it
+      self.row_parents = [[0] for _ in range(grid_h)]
+
+   # A method that labels the given occupancy mask (a boolean matrix with the
+   # size of the game grid) and returns the labels matrix and the number of
+   # different labels. Labels are consecutive values starting from 1 in the
+   # order of the raster scan (0 represents an empty cell). In the incremental
+   # mode only the rows starting from the lowest row that is changed since the
+   # last labeling (by a lock, a merge or a clear) are scanned again.
+   def label(self, occupied, incremental=True):
+      start_row = 0
+      if incremental:
+         changed_rows = np.flatnonzero((occupied != self.mask).any(axis=1))
+         # return the previous labels when the grid is not changed at all
+         if len(changed_rows) == 0:
+            return self.labels, self.num_labels
+         start_row = changed_rows[0]
+      self.mask = occupied.copy()
+      # restore the union-find structure as it was before scanning start_row
+      self.parent = self.row_parents[start_row]
+      self.scan_rows(occupied.ravel().tolist(), start_row)
+      self.labels, self.num_labels = self.resolve_labels()
+      return self.labels, self.num_labels
+
+   # A method that assigns provisional labels to the rows starting from the
+   # given row by checking the left and the lower neighbor of each cell
+   def scan_rows(self, occupied, start_row):
+      width = self.grid_width
+      provisional = self.provisional
+      for row in range(start_row, self.grid_height):
+         # save the union-find parents before scanning this row
+         self.row_parents[row] = self.parent[:]
+         parent = self.parent
+         for index in range(row * width, (row + 1) * width):
+            if not occupied[index]:
+               provisional[index] = 0
+               continue
+            lower = provisional[index - width] if row > 0 else 0
+            left = provisional[index - 1] if index % width > 0 else 0
+            if lower and left:
+               provisional[index] = self.union(lower, left)
+            elif lower or left:
+               provisional[index] = lower or left
+            else:
+               # create a new provisional label for this cell
+               provisional[index] = len(parent)
+               parent.append(len(parent))
+
+   # A method that returns the root label of the given label, compressing the
+   # path to the root along the way (path halving)
+   def find(self, label):
+      parent = self.parent
+      while parent[label] != label:
+         parent[label] = parent[parent[label]]
+         label = parent[label]
+      return label
+
+   # A method that merges the sets of the given labels and returns the root of
+   # the merged set (the smallest label is kept as the root)
+   def union(self, label1, label2):
+      root1, root2 = self.find(label1), self.find(label2)
+      if root1 < root2:
+         self.parent[root2] = root1
+         return root1
+      self.parent[root1] = root2
+      return root2
+
+   # A method that replaces the provisional label of each cell with the
+   # consecutive label of its set and returns the labels and their count
+   def resolve_labels(self):
+      roots = np.array([self.find(label) for label in range(len(self.parent))])
+      # the roots are the smallest labels of their sets, so sorting them keeps
+      # the order of the raster scan
+      different_roots = np.unique(roots[1:])
+      new_labels = np.zeros(len(roots), dtype=int)
+      new_labels[different_roots] = np.arange(1, len(different_roots) + 1)
+      labels = new_labels[roots][np.array(self.provisional)]
+      return labels.reshape(self.grid_height, self.grid_width), len(different_roots)
@@ -0,0 +1,290 @@
+from tetromino import Tetromino  # used for the pieces moved on the board
+import numpy as np  # fundamental Python module for scientific computing
+from component_labeler import ComponentLabeler  # used for finding free tiles
+from game_random import GameRandom  # used for the random values of the game
+
+# A class for modeling the rules of the game without displaying anything: the
+# engine owns the board, the current and the next tetromino, the score and the
+# game over state, so that games can be simulated without a window or a mixer
+class GameEngine:
+   # the actions that can be applied to the current tetromino by step
+   actions = ("left", "right", "down", "rotate", "drop")
+
+   # A constructor for creating the engine of a game grid with the given size,
+   # drawing the random values of the game from the given random number
+   # generator (a GameRandom with a random seed is created when rng is not
+   # given)
+   def __init__(self, grid_h, grid_w, rng=None):
+      # set the dimensions of the game grid as the given arguments
+      self.grid_height = grid_h
+      self.grid_width = grid_w
+      # set the game grid dimension values stored and used in the Tetromino class
+      Tetromino.grid_height = grid_h
+      Tetromino.grid_width = grid_w
+      # the random number generator of the game
+      self.rng = GameRandom() if rng is None else rng
+      # Initialize score
+      self.score = 0
+      # create a tile matrix to store the tiles locked on the game grid as the
+      # log2 of their numbers (0 represents an empty cell)
+      self.tile_matrix = np.zeros((grid_h, grid_w), dtype=np.uint8)
+      # the height of each column (the row above its topmost tile), kept up to
+      # date whenever the locked tiles change
+      self.column_heights = np.zeros(grid_w, dtype=int)
+      # create a labeler for the connected components of the locked tiles
+      self.labeler = ComponentLabeler(grid_h, grid_w)
+      # create the tetromino that is currently being moved on the game grid and
+      # the next tetromino that will be moved on the game grid
+      self.current_tetromino = self.create_tetromino()
+      self.next_tetromino = self.create_tetromino()
+      # the game_over flag shows whether the game is over or not
+      self.game_over = False
+
+   # A method for creating random shaped tetrominoes to enter the game grid
+   def create_tetromino(self):
+      # the type (shape) of the tetromino is determined randomly
+      tetromino_types = ['I', 'O', 'Z', 'L', 'J', 'S', 'T']
+      random_index = self.rng.pieces.randint(0, len(tetromino_types) - 1)
+      random_type = tetromino_types[random_index]
+      # create and return the tetromino
+      tetromino = Tetromino(random_type, self.rng)
+      return tetromino
+
+   # A method that applies the given action (one of the actions above) to the
+   # current tetromino and returns whether the tetromino has been moved
+   def step(self, action):
+      tetromino = self.current_tetromino
+      if self.game_over or tetromino is None:
+         return False
+      if action in ("left", "right", "down"):
+         return tetromino.move(action, self)
+      if action == "rotate":
+         rotate_count = tetromino.rotate_count
+         tetromino.rotate(self)
+         return tetromino.rotate_count != rotate_count
+      if action == "drop":
+         # hard drop: causes the tetromino to fall down to where it lands
+         y = tetromino.bottom_left_cell.y
+         tetromino.hard_drop(self)
+         return tetromino.bottom_left_cell.y != y
+      raise ValueError("unknown action: " + str(action))
+
+   # A method that moves the current tetromino down by one (auto fall) and locks
+   # it onto the grid when it cannot go down anymore. The method returns True
+   # when the tetromino has been locked and False otherwise.
+   def tick(self):
+      if self.game_over:
+         return False
+      if self.current_tetromino.move("down", self):
+         return False
+      self.lock_tetromino()
+      return True
+
+   # A method that locks the current tetromino onto the grid, resolves the
+   # merges, the full rows and the free tiles and brings in the next tetromino
+   def lock_tetromino(self):
+      # get the tile matrix of the tetromino without empty rows and columns
+      # and the position of the bottom left cell in this matrix
+      tiles, pos = self.current_tetromino.get_min_bounded_tile_matrix(True)
+      # update the game grid by locking the tiles of the landed tetromino
+      if self.update_grid(tiles, pos):
+         return
+      # check for merges when tetromino stopped
+      self.apply_merge()
+      self.clear_tiles()
+      # the next tetromino becomes the current tetromino and a new random
+      # tetromino becomes the next one
+      self.current_tetromino = self.next_tetromino
+      self.next_tetromino = self.create_tetromino()
+      # Drop down the free tiles that are not connected to the others (by
+      # using 4-component labeling) to where they land
+      self.settle_free_tiles()
+      self.clear_tiles()
+
+   # A method used checking whether the grid cell with the given row and column
+   # indexes is occupied by a tile or not (i.e., empty)
+   def is_occupied(self, row, col):
+      # considering the newly entered tetrominoes to the game grid that may
+      # have tiles with position.y >= grid_height
+      if not self.is_inside(row, col):
+         return False  # the cell is not occupied as it is outside the grid
+      # the cell is occupied by a tile if it is not 0
+      return self.tile_matrix[row, col] != 0
+
+   # A method for checking whether the cell with the given row and col indexes
+   # is inside the game grid or not
+   def is_inside(self, row, col):
+      if row < 0 or row >= self.grid_height:
+         return False
+      if col < 0 or col >= self.grid_width:
+         return False
+      return True
+
+   # Method that locks the tiles of the landed tetromino on the game grid while
+   # checking if the game is over due to having tiles above the topmost grid row.
+   # The method returns True when the game is over and False otherwise.
+   def update_grid(self, tiles_to_lock, blc_position):
+      # necessary for the display method to stop displaying the tetromino
+      self.current_tetromino = None
+      # lock the tiles of the current tetromino (tiles_to_lock) on the game grid
+      n_rows, n_cols = len(tiles_to_lock), len(tiles_to_lock[0])
+      for col in range(n_cols):
+         for row in range(n_rows):
+            # place each tile onto the game grid
+            if tiles_to_lock[row][col] is not None:
+               # compute the position of the tile on the game grid
+               x = blc_position.x + col
+               y = blc_position.y + (n_rows - 1) - row
+               if self.is_inside(y, x):
+                  self.tile_matrix[y, x] = tiles_to_lock[row][col].getExponent()
+                  self.column_heights[x] = max(self.column_heights[x], y + 1)
+               # the game is over if any placed tile is above the game grid
+               else:
+                  self.game_over = True
+      # return the game_over flag
+      return self.game_over
+
+   # A method that clears all the full rows of the game grid in a single pass:
+   # the tiles on the full rows are added to the score and the remaining rows
+   # are moved down. The indices of the cleared rows are returned.
+   def clear_tiles(self):
+      # find all the full rows by using a single reduction over the columns
+      full_rows = self.tile_matrix.all(axis=1)
+      cleared_rows = np.flatnonzero(full_rows)
+      if len(cleared_rows) == 0:
+         return cleared_rows
+      # add the numbers on the tiles of all the full rows to the score
+      self.score += int(np.left_shift(1, self.tile_matrix[full_rows], dtype=np.int64).sum())
+      # move the remaining rows down with a single copy and empty the top rows
+      n_remaining = self.grid_height - len(cleared_rows)
+      self.tile_matrix[:n_remaining] = self.tile_matrix[~full_rows]
+      self.tile_matrix[n_remaining:] = 0
+      self.update_column_heights()
+      return cleared_rows
+
+   # A method that recomputes the height of each column from the tile matrix
+   def update_column_heights(self):
+      occupied = self.tile_matrix != 0
+      top_rows = self.grid_height - np.argmax(occupied[::-1], axis=0)
+      self.column_heights = np.where(occupied.any(axis=0), top_rows, 0)
+
+   # A method that returns the row of the bottom left cell of a tetromino with
+   # the given type and rotation state when it is dropped at the given column,
+   # by using the column heights and the bottom profile of the tetromino (the
+   # merge step moves every tile down, so the columns never have gaps)
+   def get_landing_row(self, shape, rotate_count, x):
+      state = Tetromino.rotation_states[shape][rotate_count]
+      return max(self.column_heights[x + col] - height for col, height in state.bottom_profile)
+
+   # A method that merges the vertically adjacent tiles with the same number in
+   # all the columns at once. Each step moves down by one row every tile that
+   # has an empty cell below it and then merges the equal pairs from the bottom
+   # of each column upwards. The steps are repeated while any column changes.
+   # The number of merges in each column and the score gained are returned.
+   def apply_merge(self):
+      merge_counts = np.zeros(self.grid_width, dtype=int)
+      score_delta = 0
+      row_indices = np.arange(self.grid_height - 1)[:, None]
+      board = self.tile_matrix
+      while True:
+         # move down the tiles that have an empty cell anywhere below them
+         empty = board == 0
+         moving = np.zeros_like(empty)
+         moving[1:] = ~empty[1:] & np.logical_or.accumulate(empty, axis=0)[:-1]
+         if moving.any():
+            moved = board[1:][moving[1:]]
+            board[moving] = 0
+            board[:-1][moving[1:]] = moved
+         # find the equal pairs of tiles (row, row + 1) and merge the pairs at
+         # even offsets from the start of each run of equal pairs, as merging
+         # a pair leaves the upper tile of the next pair empty
+         same = (board[:-1] == board[1:]) & (board[:-1] != 0)
+         run_starts = same.copy()
+         run_starts[1:] &= ~same[:-1]
+         start_indices = np.maximum.accumulate(np.where(run_starts, row_indices, 0), axis=0)
+         merging = same & ((row_indices - start_indices) % 2 == 0)
+         if merging.any():
+            board[:-1][merging] += 1
+            board[1:][merging] = 0
+            score_delta += int(np.left_shift(1, board[:-1][merging], dtype=np.int64).sum())
+            merge_counts += merging.sum(axis=0)
+         elif not moving.any():
+            break
+      self.score += score_delta
+      self.update_column_heights()
+      return merge_counts, score_delta
+
+   # A method that drops the free tiles (the tiles whose components do not
+   # touch the bottommost row) to where they land in a single pass. The free
+   # components fall together one row at a time and each component stops when
+   # it touches the bottom of the grid or a tile that has already stopped. The
+   # number of moved tiles and the longest drop distance are returned.
+   def settle_free_tiles(self):
+      labels, num_labels = self.labeler.label(self.tile_matrix != 0)
+      # the components touching the bottommost row are grounded (label 0 is
+      # used for the empty cells)
+      grounded = np.zeros(num_labels + 1, dtype=bool)
+      grounded[0] = True
+      grounded[labels[0]] = True
+      free_labels = np.flatnonzero(~grounded)
+      if len(free_labels) == 0:
+         return 0, 0
+      # the cells of each free component and its tentative drop distance
+      # considering only the grounded tiles
+      cells = {l: np.nonzero(labels == l) for l in free_labels}
+      static = (labels != 0) & grounded[labels]
+      tops_below = self.tops_below(static)
+      drops = {l: self.contact_distance(cells[l], tops_below, 0) for l in free_labels}
+      # fix the drop distances in increasing order, as a component can only
+      # touch another component after the other one has stopped
+      final_cells = []
+      while drops:
+         stopped = min(drops, key=drops.get)
+         drop = drops.pop(stopped)
+         rows, cols = cells[stopped]
+         final_cells.append((rows, cols, rows - drop, drop))
+         stopped_mask = np.zeros_like(static)
+         stopped_mask[rows - drop, cols] = True
+         tops_below = self.tops_below(stopped_mask)
+         for l in drops:
+            drops[l] = min(drops[l], self.contact_distance(cells[l], tops_below, drop))
+      # move all the free tiles to their final positions at once
+      numbers = [self.tile_matrix[rows, cols] for rows, cols, _, _ in final_cells]
+      for rows, cols, _, _ in final_cells:
+         self.tile_matrix[rows, cols] = 0
+      for (_, cols, new_rows, _), values in zip(final_cells, numbers):
+         self.tile_matrix[new_rows, cols] = values
+      self.update_column_heights()
+      num_moved = sum(len(rows) for rows, _, _, _ in final_cells)
+      return num_moved, max(drop for _, _, _, drop in final_cells)
+
+   # A method that returns the row index of the topmost occupied cell at or
+   # below each cell of the given occupancy mask (-1 when there is none)
+   def tops_below(self, occupied):
+      row_indices = np.arange(self.grid_height)[:, None]
+      return np.maximum.accumulate(np.where(occupied, row_indices, -1), axis=0)
+
+   # A method that returns the distance a component with the given cells can
+   # fall before it touches the bottom of the grid or the tiles described by
+   # tops_below (from below or from a side). Contacts at distances not greater
+   # than min_drop are ignored.
+   def contact_distance(self, cells, tops_below, min_drop):
+      rows, cols = cells
+      distances = []
+      # look for the tiles below (dx = 0) and on the sides of each cell that
+      # are at least min_drop + 1 rows lower than the touching position
+      for dx in (-1, 0, 1):
+         look_rows = rows - min_drop - (2 if dx == 0 else 1)
+         look_cols = cols + dx
+         inside = (look_cols >= 0) & (look_cols < self.grid_width)
+         look_rows, look_cols = look_rows[inside], look_cols[inside]
+         tops = np.where(look_rows >= 0, tops_below[np.maximum(look_rows, 0), look_cols], -1)
+         if dx == 0:
+            # touching a tile below (or the bottom of the grid when top is -1)
+            distances.append(rows[inside] - 1 - tops)
+         else:
+            # touching a tile on the left or on the right
+            distances.append((rows[inside] - tops)[tops >= 0])
+      distances = np.concatenate(distances)
+      distances = distances[distances > min_drop]
+      return int(distances.min()) if len(distances) > 0 else int(rows.min())
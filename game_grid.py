@@ -2,29 +2,26 @@
 import lib.stddraw as stddraw  # used for displaying the game grid
 from lib.color import Color  # used for coloring the game grid
 from point import Point  # used for tile positions
+from tile import Tile  # used for drawing the tiles locked on the game grid
 import numpy as np  # fundamental Python module for scientific computing
-import copy as cp
 from player import Player
+from game_engine import GameEngine  # used for the rules of the game
+from widgets import Button  # used for the pause button next to the game grid
 
-# A class for modeling the game grid
+# A class for displaying the game grid (the state of the game is kept by the
+# engine, the game grid only draws it)
 class GameGrid:
-   # A constructor for creating the game grid based on the given arguments
-   def __init__(self, grid_h, grid_w):
+   # A constructor for creating the game grid based on the given arguments (a
+   # new player is created from the save file when no player is given, and the
+   # random number generator of the game is passed to the engine)
+   def __init__(self, grid_h, grid_w, player=None, rng=None):
       # Create player
-      self.player = Player()
-      # Initialize score
-      self.score = 0
+      self.player = Player() if player is None else player
       # set the dimensions of the game grid as the given arguments
       self.grid_height = grid_h
       self.grid_width = grid_w
-      # create a tile matrix to store the tiles locked on the game grid
-      self.tile_matrix = np.full((grid_h, grid_w), None)
-      # create the tetromino that is currently being moved on the game grid
-      self.current_tetromino = None
-      # create the next tetromino that will be move on the game grid
-      self.next_tetromino = None
-      # the game_over flag shows whether the game is over or not
-      self.game_over = False
+      # create the engine that keeps the board, the tetrominoes and the score
+      self.engine = GameEngine(grid_h, grid_w, rng)
       # set the color used for the empty grid cells
       self.empty_cell_color = Color(206, 195, 181)
       # set the colors used for the grid lines and the grid boundaries
@@ -33,87 +30,193 @@ class GameGrid:
       # thickness values used for the grid lines and the grid boundaries
       self.line_thickness = 0.002
       self.box_thickness = 5 * self.line_thickness
+      # the atlas of the tile sprites (by the log2 of the tile numbers), the
+      # background layer and the scale and the colors they are drawn with
+      self.tile_sprites, self.sprites_key = {}, None
+      self.background_layer = None
+      # the values of the cells and the panel shown by the last call of display
+      # (None until everything is drawn)
+      self.shown_frame, self.shown_panel = None, None
+      # the button for pausing the game (drawn on the background layer)
+      self.pause_button = Button(13.5, 10.5, 2, 1, "Pause", Color(237, 224, 200),
+                                 Color(255, 255, 255), 20)
 
+   # A method for displaying the game grid. Only the cells and the parts of the
+   # panel that are changed since the last displayed frame are drawn again and
+   # updated on the window (everything is drawn after the grid is invalidated).
+   # The method waits for msec milliseconds after showing the drawing.
+   def display(self, msec=0):
+      # the values of the cells and the panel to be displayed in this frame
+      frame, panel = self.get_frame(), self.get_panel()
+      # draw the sprites again if the scale or the colors are changed
+      self.update_sprites()
+      if self.shown_frame is None:
+         self.draw_all()
+         regions = None
+      else:
+         regions = self.draw_changes(frame, panel)
+      self.shown_frame, self.shown_panel = frame, panel
+      # show the resulting drawing and wait for the given duration (the game
+      # loop decides the timing of the frames)
+      self.show(regions, msec)
 
-   # A method for displaying the game grid
-   def display(self):
-      # clear the background to empty_cell_color
-      stddraw.clear(self.empty_cell_color)
-      # draw the game grid
-      self.draw_grid()
-      # draw the score
-      self.display_Score()
+   # A method for showing the given regions of the drawing (or the whole
+   # drawing when regions is None) and waiting for msec milliseconds
+   def show(self, regions, msec):
+      if regions is None:
+         stddraw.show(msec)
+      else:
+         stddraw.showRegions(regions, msec)
 
-      # Pause Game button
-      button_width = 2
-      button_height = 1
-      button_x = 13.5
-      button_y = 10.5
-      button_color = Color(237, 224, 200)
-      stddraw.setPenColor(button_color)
-      stddraw.filledRectangle(button_x, button_y, button_width, button_height)
-      stddraw.setPenColor(Color(255, 255, 255))
-      stddraw.setFontFamily("Arial")
-      stddraw.setFontSize(20)
-      stddraw.text(button_x + button_width / 2, button_y + button_height / 2, "Pause")
+   # A method that makes the next call of display draw everything again (used
+   # when something else is drawn on the canvas, e.g., the pause menu)
+   def invalidate(self):
+      self.shown_frame, self.shown_panel = None, None
 
-      if stddraw.mousePressed():
-         mouse_x, mouse_y = stddraw.mouseX(), stddraw.mouseY() #get the coordinates of mouse that has been clicked
-         # check if these coordinates are inside the pause button
-         if mouse_x >= button_x - button_width/2 and mouse_x <= button_x + button_width/2:
-            if mouse_y >= button_y - button_height/2 and mouse_y <= button_y + button_height/2:
-               self.pause_screen(self.grid_width, self.grid_height)
+   # A method that returns the values of the cells of the game grid as they are
+   # displayed: the exponent of each locked tile, the negated exponent of each
+   # tile of the current tetromino (drawn over the grid lines) and 0 otherwise
+   def get_frame(self):
+      frame = self.engine.tile_matrix.astype(np.int16)
+      tetromino = self.engine.current_tetromino
+      if tetromino is not None:
+         for tile, (col, row) in zip(tetromino.tiles, tetromino.get_rotation_state().cells):
+            position = tetromino.get_cell_position(row, col)
+            if position.y < self.grid_height:
+               frame[position.y, position.x] = -tile.getExponent()
+      return frame
 
+   # A method that returns the values displayed on the panel next to the game
+   # grid: the score, the high score and the next tetromino
+   def get_panel(self):
+      next_tetromino = self.engine.next_tetromino
+      if next_tetromino is None:
+         next_piece = None
+      else:
+         next_piece = (next_tetromino.type, tuple(tile.number for tile in next_tetromino.tiles))
+      return self.engine.score, self.player.getHighScore(), next_piece
 
+   # A method for drawing the whole game grid and the panel next to it
+   def draw_all(self):
+      # draw the background layer (the empty cells, the grid lines and the
+      # static parts of the panel)
+      self.draw_background()
+      # draw the game grid
+      self.draw_grid()
+      # draw the score
+      self.display_Score()
 
       # draw the current/active tetromino if it is not None
       # (the case when the game grid is updated)
-      if self.current_tetromino is not None:
-         self.current_tetromino.draw()
+      if self.engine.current_tetromino is not None:
+         self.draw_tetromino(self.engine.current_tetromino)
       # Draw the next tetromino next to the game grid if it is not None
-      if self.next_tetromino is not None:
-         self.next_tetromino.draw_outside()
+      if self.engine.next_tetromino is not None:
+         self.draw_next_tetromino(self.engine.next_tetromino)
       # draw a box around the game grid
       self.draw_boundaries()
-      # show the resulting drawing with a pause duration according to difficulty level
-      if (self.player.getDiff() == 0):
-         stddraw.show(250)
-      if (self.player.getDiff() == 1):
-         stddraw.show(200)
-      if (self.player.getDiff() == 2):
-         stddraw.show(125)
-
-
 
+   # A method for drawing again only the cells and the parts of the panel that
+   # are changed since the last displayed frame. Each part is drawn with the
+   # drawing restricted to its region, in the same order as in draw_all, and
+   # the regions (x, y, width, height) are returned.
+   def draw_changes(self, frame, panel):
+      regions = []
+      for row, col in zip(*np.nonzero(frame != self.shown_frame)):
+         region = (col - 0.5, row - 0.5, 1, 1)
+         stddraw.setClip(*region)
+         self.draw_cell(row, col, int(frame[row, col]))
+         self.draw_boundaries()
+         regions.append(region)
+      # the part of the panel with the score and the high score
+      if panel[:2] != self.shown_panel[:2]:
+         region = (self.grid_width - 0.5, 12.5, 6, self.grid_height - 12.5)
+         stddraw.setClip(*region)
+         self.draw_background()
+         self.display_Score()
+         self.draw_boundaries()
+         regions.append(region)
+      # the part of the panel with the next tetromino
+      if panel[2] != self.shown_panel[2]:
+         region = (self.grid_width - 0.5, -0.5, 6, 7)
+         stddraw.setClip(*region)
+         self.draw_background()
+         if self.engine.next_tetromino is not None:
+            self.draw_next_tetromino(self.engine.next_tetromino)
+         self.draw_boundaries()
+         regions.append(region)
+      stddraw.setClip()  # remove the restriction on the drawing
+      return regions
 
+   # A method for drawing the cell of the game grid with the given row and
+   # column indexes that displays the given value (as returned by get_frame)
+   def draw_cell(self, row, col, value):
+      self.draw_background()
+      if value > 0:
+         self.draw_tile(Tile(1 << value), Point(col, row))
+         # draw the inner lines of the game grid on the sides of the cell over
+         # the locked tile
+         self.draw_grid_lines(np.array([col - 0.5, col + 0.5]), np.array([row - 0.5, row + 0.5]))
+      elif value < 0:
+         self.draw_tile(Tile(1 << -value), Point(col, row))
 
    # A method for drawing the cells and the lines of the game grid
 
    def draw_grid(self):
-      # for each cell of the game grid
-      for row in range(self.grid_height):
-         for col in range(self.grid_width):
-            # if the current grid cell is occupied by a tile
-            if self.tile_matrix[row][col] is not None:
-               # draw this tile
-               self.tile_matrix[row][col].draw(Point(col, row))
-      # draw the inner lines of the game grid
+      # draw the sprites of all the tiles locked on the game grid at once
+      tile_matrix = self.engine.tile_matrix
+      rows, cols = np.nonzero(tile_matrix)
+      sprites = [self.get_tile_sprite(exponent) for exponent in tile_matrix[rows, cols].tolist()]
+      stddraw.sprites(sprites, cols, rows)
+      # draw the inner lines of the game grid over the locked tiles
+      self.draw_grid_lines()
+
+   # A method for drawing the inner lines of the game grid at the given x and
+   # y values (all the inner lines by default), all at once
+   def draw_grid_lines(self, xs=None, ys=None):
       stddraw.setPenColor(self.line_color)
       stddraw.setPenRadius(self.line_thickness)
       # x and y ranges for the game grid
       start_x, end_x = -0.5, self.grid_width - 0.5
       start_y, end_y = -0.5, self.grid_height - 0.5
-      for x in np.arange(start_x + 1, end_x, 1):  # vertical inner lines
-         stddraw.line(x, start_y, x, end_y)
-      for y in np.arange(start_y + 1, end_y, 1):  # horizontal inner lines
-         stddraw.line(start_x, y, end_x, y)
+      if xs is None:
+         xs = np.arange(start_x + 1, end_x, 1)
+         ys = np.arange(start_y + 1, end_y, 1)
+      xs = xs[(xs > start_x) & (xs < end_x)]  # vertical inner lines
+      ys = ys[(ys > start_y) & (ys < end_y)]  # horizontal inner lines
+      stddraw.lines(np.concatenate((xs, np.full(len(ys), start_x))),
+                    np.concatenate((np.full(len(xs), start_y), ys)),
+                    np.concatenate((xs, np.full(len(ys), end_x))),
+                    np.concatenate((np.full(len(xs), end_y), ys)))
+      stddraw.setPenRadius()  # reset the pen radius to its default value
 
+   # A method for drawing the background layer that contains the empty cells,
+   # the grid lines and the static parts of the panel (drawn once onto a
+   # sprite and then copied)
+   def draw_background(self):
+      x, y, width, height = self.get_canvas_region()
+      stddraw.sprite(self.background_layer, x + width / 2, y + height / 2)
+
+   # A method that returns the region (x, y, width, height) covered by the game
+   # grid and the panel next to it
+   def get_canvas_region(self):
+      return -0.5, -0.5, self.grid_width + 6, self.grid_height
+
+   # A method for drawing the background layer onto a new sprite
+   def render_background(self):
+      stddraw.beginSprite(*self.get_canvas_region())
+      stddraw.clear(self.empty_cell_color)
+      self.draw_grid_lines()
+      self.draw_next_text()
+      self.pause_button.draw()
+      return stddraw.endSprite()
+
+   # A method for drawing the title of the next tetromino on the panel
+   def draw_next_text(self):
       stddraw.setFontSize(25)
       stddraw.setPenColor(Color(255, 255, 255))
       stddraw.text(14.5, 5.5, "NEXT:")
 
-      stddraw.setPenRadius()  # reset the pen radius to its default value
-
    # A method for drawing the boundaries around the game grid
    def draw_boundaries(self):
       # draw a bounding box around the game grid as a rectangle
@@ -126,95 +229,99 @@ class GameGrid:
       stddraw.rectangle(pos_x, pos_y, self.grid_width, self.grid_height)
       stddraw.setPenRadius()  # reset the pen radius to its default value
 
-   # A method used checking whether the grid cell with the given row and column
-   # indexes is occupied by a tile or not (i.e., empty)
-   def is_occupied(self, row, col):
-      # considering the newly entered tetrominoes to the game grid that may
-      # have tiles with position.y >= grid_height
-      if not self.is_inside(row, col):
-         return False  # the cell is not occupied as it is outside the grid
-      # the cell is occupied by a tile if it is not None
-      return self.tile_matrix[row][col] is not None
-
-   # A method for checking whether the cell with the given row and col indexes
-   # is inside the game grid or not
-   def is_inside(self, row, col):
-      if row < 0 or row >= self.grid_height:
-         return False
-      if col < 0 or col >= self.grid_width:
-         return False
-      return True
-
-   # Method that locks the tiles of the landed tetromino on the game grid while
-   # checking if the game is over due to having tiles above the topmost grid row.
-   # The method returns True when the game is over and False otherwise.
-   def update_grid(self, tiles_to_lock, blc_position):
-      # necessary for the display method to stop displaying the tetromino
-      self.current_tetromino = None
-      # lock the tiles of the current tetromino (tiles_to_lock) on the game grid
-      n_rows, n_cols = len(tiles_to_lock), len(tiles_to_lock[0])
-      for col in range(n_cols):
-         for row in range(n_rows):
-            # place each tile onto the game grid
-            if tiles_to_lock[row][col] is not None:
-               # compute the position of the tile on the game grid
-               pos = Point()
-               pos.x = blc_position.x + col
-               pos.y = blc_position.y + (n_rows - 1) - row
-               if self.is_inside(pos.y, pos.x):
-                  self.tile_matrix[pos.y][pos.x] = tiles_to_lock[row][col]
-               # the game is over if any placed tile is above the game grid
-               else:
-                  self.game_over = True
-      # return the game_over flag
-      return self.game_over
-
-   def clear_tiles(self):
-      row = 0
-      total_score = 0
-      while (row < self.grid_height):
-         # check if the row is full
-         if all(self.tile_matrix[row]):
-            total_score += sum(element.number for element in self.tile_matrix[row])
-            # remove the row from the game grid
-            self.tile_matrix = np.delete(self.tile_matrix, row, 0)
-            # add an empty row to the game grid
-            self.tile_matrix = np.insert(self.tile_matrix, -1, None, 0)
-         else:
-            row += 1
-      self.score += total_score
-
-   # draws the ghost tetromino on the game grid
+   # A method for drawing the given tile at a given position with a given length
+   def draw_tile(self, tile, position, length=1):  # length defaults to 1
+      # copy the sprite of the tile when it is drawn with the size of a cell
+      if length == 1:
+         stddraw.sprite(self.get_tile_sprite(tile.getExponent()), position.x, position.y)
+      else:
+         self.render_tile(tile.number, position, length)
+
+   # A method for drawing a tile with the given number at a given position with
+   # a given length by using the drawing functions
+   def render_tile(self, number, position, length=1):
+      # draw the tile as a filled square
+      stddraw.setPenColor(Tile(number).background_color)
+      stddraw.filledSquare(position.x, position.y, length / 2)
+      # draw the bounding box around the tile as a square
+      stddraw.setPenColor(Tile.box_color)
+      stddraw.setPenRadius(Tile.boundary_thickness)
+      stddraw.square(position.x, position.y, length / 2)
+      stddraw.setPenRadius()  # reset the pen radius to its default value
+      # draw the number on the tile
+      stddraw.setPenColor(Tile.foreground_color)
+      stddraw.setFontFamily(Tile.font_family)
+      stddraw.setFontSize(Tile.font_size)
+      stddraw.text(position.x, position.y, str(number))
+
+   # A method that returns the sprite of the tiles with the given exponent (the
+   # log2 of their numbers), drawing it when it is not in the atlas yet
+   def get_tile_sprite(self, exponent):
+      sprite = self.tile_sprites.get(exponent)
+      if sprite is None:
+         # draw the tile at the bottom left cell of the grid onto the sprite
+         stddraw.beginSprite(-0.5, -0.5, 1, 1)
+         self.render_tile(1 << exponent, Point(0, 0))
+         sprite = self.tile_sprites[exponent] = stddraw.endSprite()
+      return sprite
+
+   # A method that empties the atlas of the tile sprites when the scale of the
+   # canvas or the colors of the tiles are changed since the sprites are drawn,
+   # and draws the sprites of the tiles from 2 to 2048 and the background layer
+   # again
+   def update_sprites(self):
+      palette = tuple((number, str(color)) for number, color in Tile.background_colors.items())
+      key = (stddraw.getScale(), palette, str(Tile.foreground_color), str(Tile.box_color),
+             str(self.empty_cell_color), str(self.line_color), Tile.font_family,
+             Tile.font_size, Tile.boundary_thickness)
+      if key == self.sprites_key:
+         return
+      self.tile_sprites, self.sprites_key = {}, key
+      for exponent in range(1, 12):
+         self.get_tile_sprite(exponent)
+      self.background_layer = self.render_background()
+
+   # A method for drawing the given tetromino on the game grid (at the given row
+   # of the bottom left cell instead of its current row when bottom_y is given)
+   def draw_tetromino(self, tetromino, bottom_y=None):
+      dy = 0 if bottom_y is None else bottom_y - tetromino.bottom_left_cell.y
+      for tile, (col, row) in zip(tetromino.tiles, tetromino.get_rotation_state().cells):
+         # get the position of the tile
+         position = tetromino.get_cell_position(row, col)
+         position.y += dy
+         # draw only the tiles that are inside the game grid
+         if position.y < self.grid_height:
+            self.draw_tile(tile, position)
+
+   # Method for drawing upcoming tetrominoes on the blank space right next to the game grid
+   def draw_next_tetromino(self, tetromino):
+      if (tetromino.type == 'O'):
+         position_x, position_y = 14, 3.5 # Optimizing drawing function for square because it's matrix has only 4 elements.
+      else:
+         position_x, position_y = 13.5, 4
+      for tile, (col, row) in zip(tetromino.tiles, tetromino.get_rotation_state().cells):
+         # Get the position for each tile relative to the provided position
+         tile_position = Point(position_x + col, position_y - row)
+         self.draw_tile(tile, tile_position)
+
+   # draws the ghost tetromino on the game grid, that is, the current tetromino
+   # at the row where it lands
    def ghost_tetromino(self):
-      # the ghost tetromino is the same as the current tetromino, but with a
-      # different color
-      ghost_tetromino = cp.deepcopy(self.current_tetromino)
-      while ghost_tetromino.can_be_moved("down", self):
-         ghost_tetromino.move("down", self)
-      ghost_tetromino.draw(True)
-
-   # Takes list of free tiles and moves them one row down
-   def move_free_tiles(self, free_tiles):
-      for row in range(self.grid_height):  # does not contain the bottommost row
-         for col in range(self.grid_width):
-            if free_tiles[row][col]:
-               free_tile_copy = cp.deepcopy(self.tile_matrix[row][col])
-               self.tile_matrix[row - 1][col] = free_tile_copy
-               dx, dy = 0, -1  # change of the position in x and y directions
-               self.tile_matrix[row - 1][col].move(dx, dy)
-               self.tile_matrix[row][col] = None
+      tetromino = self.engine.current_tetromino
+      landing_y = self.engine.get_landing_row(tetromino.type, tetromino.rotate_count, tetromino.bottom_left_cell.x)
+      self.draw_tetromino(tetromino, min(tetromino.bottom_left_cell.y, landing_y))
 
    # Displays the score on the top right of the main game screen
    def display_Score(self):
+      stddraw.setFontSize(25)
       stddraw.setPenRadius(150)
       stddraw.setPenColor(Color(255, 255, 255))
-      text_to_display = "SCORE: " + str(self.score)
-      stddraw.text(14.5, 16.5, text_to_display)
+      text_to_display = "SCORE: " + str(self.engine.score)
       high_score_text = "HIGH SCORE: " + str(self.player.getHighScore())
-      stddraw.text(14.5, 13.5, high_score_text)
+      stddraw.texts(14.5, [16.5, 13.5], [text_to_display, high_score_text])
 
       # return the value of the game_over flag
-      return self.game_over
+      return self.engine.game_over
 
 
 
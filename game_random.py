@@ -0,0 +1,25 @@
+import random  # used for the random number generators of the streams
+
+# A class for modeling the random number generator of a game as independent
+# streams for the types of the tetrominoes, the columns they enter the game grid
+# from and the numbers on their tiles. Each stream is seeded from the seed of
+# the game and its name, so a game created with the same seed is repeated
+# exactly and the values drawn from a stream do not depend on the other streams.
+class GameRandom:
+   # A constructor for creating the streams of a game with the given seed (a
+   # random seed is chosen when no seed is given)
+   def __init__(self, seed=None):
+      if seed is None:
+         seed = random.SystemRandom().getrandbits(64)
+      self.seed = seed
+      # the stream used for choosing the types of the tetrominoes
+      self.pieces = self.create_stream("pieces")
+      # the stream used for choosing the columns the tetrominoes enter from
+      self.spawn_columns = self.create_stream("spawn columns")
+      # the stream used for choosing the numbers (2 or 4) on the tiles
+      self.tile_values = self.create_stream("tile values")
+
+   # A method that returns a new stream seeded from the seed of the game and
+   # the given name of the stream
+   def create_stream(self, name):
+      return random.Random("%s/%s" % (self.seed, name))
@@ -12,6 +12,8 @@ class Color:
     A Color object models an RGB color.
     """
 
+    __slots__ = ('_r', '_g', '_b')
+
     #-------------------------------------------------------------------
 
     def __init__(self, r=0, g=0, b=0):
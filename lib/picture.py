@@ -98,3 +98,18 @@ class Picture:
         """
         pygameColor = pygame.Color(c.getRed(), c.getGreen(), c.getBlue(), 0)
         self._surface.set_at((x, y), pygameColor)
+
+    #-------------------------------------------------------------------
+
+    def convert(self):
+        """
+        Convert self to the pixel format of the display window (keeping
+        its transparency, if any) so that it is drawn faster.  Do
+        nothing if the display window is not created yet.
+        """
+        if pygame.display.get_surface() is None:
+            return
+        if self._surface.get_flags() & pygame.SRCALPHA:
+            self._surface = self._surface.convert_alpha()
+        else:
+            self._surface = self._surface.convert()
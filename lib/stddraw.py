@@ -10,15 +10,15 @@ commonly used Color objects defined in the color module.
 import time
 import os
 import sys
+import math
+import functools
+import collections
+import numpy as np
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
 import pygame
 import pygame.gfxdraw
 import pygame.font
-
-import tkinter as Tkinter
-import tkinter.messagebox as tkMessageBox
-import tkinter.filedialog as tkFileDialog
 	
 #-----------------------------------------------------------------------
 
@@ -95,11 +95,28 @@ _canvasWidth = float(_DEFAULT_CANVAS_SIZE)
 _canvasHeight = float(_DEFAULT_CANVAS_SIZE)
 _penRadius = None
 _penColor = _DEFAULT_PEN_COLOR
-_keysTyped = []
+
+# The queue of the keys typed by the user as (key, time) pairs, where
+# time is the time.perf_counter() value at which the key was typed
+_keysTyped = collections.deque()
+
+# The delay and the interval (in seconds) of the key repeat and the
+# keys that are repeated while they are held down (no key is repeated
+# when _keyRepeat is None)
+_keyRepeat = None
+
+# The time of the next repeat of each repeated key held down
+_keysHeld = {}
+
+# The total time (in seconds) spent waiting for events in wait()
+_timeWaited = 0.0
 
 # Has the window been created?
 _windowCreated = False
 
+# Is the drawing done offscreen (without a window)?
+_offscreen = False
+
 #-----------------------------------------------------------------------
 # Begin added by Alan J. Broder
 #-----------------------------------------------------------------------
@@ -144,6 +161,21 @@ def _factorX(w):
 def _factorY(h):
     return h * _canvasHeight / abs(_ymax - _ymin)
 
+# Private functions to scale and factor arrays of X and Y values at once
+# (with the same arithmetic as the functions above).
+
+def _scaleXs(x):
+    return _canvasWidth * (np.asarray(x, dtype=float) - _xmin) / (_xmax - _xmin)
+
+def _scaleYs(y):
+    return _canvasHeight * (_ymax - np.asarray(y, dtype=float)) / (_ymax - _ymin)
+
+def _factorXs(w):
+    return np.asarray(w, dtype=float) * _canvasWidth / abs(_xmax - _xmin)
+
+def _factorYs(h):
+    return np.asarray(h, dtype=float) * _canvasHeight / abs(_ymax - _ymin)
+
 #-----------------------------------------------------------------------
 # Begin added by Alan J. Broder
 #-----------------------------------------------------------------------
@@ -160,17 +192,22 @@ def _userY(y):
     
 #-----------------------------------------------------------------------
 
-def setCanvasSize(w=_DEFAULT_CANVAS_SIZE, h=_DEFAULT_CANVAS_SIZE):
+def setCanvasSize(w=_DEFAULT_CANVAS_SIZE, h=_DEFAULT_CANVAS_SIZE,
+                  offscreen=False):
     """
     Set the size of the canvas to w pixels wide and h pixels high.
     Calling this function is optional. If you call it, you must do
-    so before calling any drawing function.
+    so before calling any drawing function. If offscreen is True, no
+    window is opened: the drawing is done on the background canvas
+    only (by using the SDL dummy video driver), which can be read by
+    using pixels().
     """
     global _background
     global _surface
     global _canvasWidth
     global _canvasHeight
     global _windowCreated
+    global _offscreen
 
     if _windowCreated:
         raise Exception('The stddraw window already was created')
@@ -178,6 +215,13 @@ def setCanvasSize(w=_DEFAULT_CANVAS_SIZE, h=_DEFAULT_CANVAS_SIZE):
     if (w < 1) or (h < 1):
         raise Exception('width and height must be positive')
 
+    if offscreen:
+        # The video driver is chosen when the display is initialized.
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        if pygame.display.get_init() and \
+            (pygame.display.get_driver() != 'dummy'):
+            pygame.display.quit()
+    _offscreen = offscreen
     _canvasWidth = w
     _canvasHeight = h
     _background = pygame.display.set_mode([w, h])
@@ -216,6 +260,13 @@ def setYscale(min=_DEFAULT_YMIN, max=_DEFAULT_YMAX):
     _ymin = min - _BORDER * size
     _ymax = max + _BORDER * size
 
+def getScale():
+    """
+    Return the scale of the canvas as a tuple (xmin, xmax, ymin, ymax,
+    width, height), where width and height are in pixels.
+    """
+    return (_xmin, _xmax, _ymin, _ymax, _canvasWidth, _canvasHeight)
+
 def setPenRadius(r=_DEFAULT_PEN_RADIUS):
     """
     Set the pen radius to r, thus affecting the subsequent drawing
@@ -251,6 +302,18 @@ def setFontSize(s=_DEFAULT_FONT_SIZE):
     global _fontSize
     _fontSize = s
 
+def setClip(x=None, y=None, w=None, h=None):
+    """
+    Restrict the subsequent drawing to the rectangle of width w and
+    height h whose lower left point is (x, y). Calling this function
+    without arguments removes the restriction.
+    """
+    _makeSureWindowCreated()
+    if x is None:
+        _surface.set_clip(None)
+    else:
+        _surface.set_clip(_pixelRect(x, y, w, h))
+
 #-----------------------------------------------------------------------
 
 def _makeSureWindowCreated():
@@ -489,8 +552,7 @@ def text(x, y, s):
     y = float(y)
     xs = _scaleX(x)
     ys = _scaleY(y)
-    font = pygame.font.SysFont(_fontFamily, _fontSize)
-    text = font.render(s, 1, _pygameColor(_penColor))
+    text = _renderText(s, _fontFamily, _fontSize, False, _colorKey(_penColor))
     textpos = text.get_rect(center=(xs, ys))
     _surface.blit(text, textpos)
 
@@ -503,11 +565,133 @@ def boldText(x, y, s):
     y = float(y)
     xs = _scaleX(x)
     ys = _scaleY(y)
-    font = pygame.font.SysFont(_fontFamily, _fontSize, True)
-    text = font.render(s, 1, _pygameColor(_penColor))
+    text = _renderText(s, _fontFamily, _fontSize, True, _colorKey(_penColor))
     textpos = text.get_rect(center=(xs, ys))
     _surface.blit(text, textpos)
 
+#-----------------------------------------------------------------------
+
+# Functions to draw many shapes or texts at once. Each function draws
+# the same as calling the corresponding function above for each
+# element of the given arrays (scalars are used for all the elements),
+# but the coordinates are transformed all at once and the pen color is
+# converted once.
+
+def lines(x0, y0, x1, y1):
+    """
+    Draw on the background canvas a line from (x0[i], y0[i]) to
+    (x1[i], y1[i]) for each i.
+    """
+    _makeSureWindowCreated()
+    x0, y0, x1, y1 = np.broadcast_arrays(x0, y0, x1, y1)
+    lineWidth = _penRadius
+    if lineWidth == 0.0: lineWidth = 1.0
+    lineWidth = int(round(lineWidth))
+    color = _pygameColor(_penColor)
+    points = zip(_scaleXs(x0).ravel().tolist(), _scaleYs(y0).ravel().tolist(),
+                 _scaleXs(x1).ravel().tolist(), _scaleYs(y1).ravel().tolist())
+    for x0s, y0s, x1s, y1s in points:
+        pygame.draw.line(_surface, color, (x0s, y0s), (x1s, y1s), lineWidth)
+
+def _rectangles(x, y, w, h, lineWidth):
+    """
+    Draw on the background canvas a rectangle of width w[i] and height
+    h[i] whose lower left point is (x[i], y[i]) for each i, filled when
+    lineWidth is 0.
+    """
+    _makeSureWindowCreated()
+    x, y, w, h = np.broadcast_arrays(x, y, w, h)
+    color = _pygameColor(_penColor)
+    rects = zip(x.ravel().tolist(), y.ravel().tolist(),
+                _scaleXs(x).ravel().tolist(), _scaleYs(y).ravel().tolist(),
+                _factorXs(w).ravel().tolist(), _factorYs(h).ravel().tolist())
+    for xi, yi, xs, ys, ws, hs in rects:
+        # If the rectangle is too small, then simply draw a pixel.
+        if (ws <= 1.0) and (hs <= 1.0):
+            _pixel(xi, yi)
+        else:
+            pygame.draw.rect(_surface, color,
+                pygame.Rect(xs, ys-hs, ws, hs), lineWidth)
+
+def filledRectangles(x, y, w, h):
+    """
+    Draw on the background canvas a filled rectangle of width w[i] and
+    height h[i] whose lower left point is (x[i], y[i]) for each i.
+    """
+    _rectangles(x, y, w, h, 0)
+
+def squares(x, y, r):
+    """
+    Draw on the background canvas a square whose sides are of length
+    2r[i], centered on (x[i], y[i]) for each i.
+    """
+    x, y, r = np.broadcast_arrays(
+        np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+        np.asarray(r, dtype=float))
+    _rectangles(x-r, y-r, 2.0*r, 2.0*r, int(round(_penRadius)))
+
+def texts(x, y, strings):
+    """
+    Draw strings[i] on the background canvas centered at (x[i], y[i])
+    for each i.
+    """
+    _makeSureWindowCreated()
+    color = _colorKey(_penColor)
+    xs = np.broadcast_to(_scaleXs(x), (len(strings),)).tolist()
+    ys = np.broadcast_to(_scaleYs(y), (len(strings),)).tolist()
+    blits = []
+    for xi, yi, s in zip(xs, ys, strings):
+        text = _renderText(s, _fontFamily, _fontSize, False, color)
+        blits.append((text, text.get_rect(center=(xi, yi))))
+    _surface.blits(blits, False)
+
+#-----------------------------------------------------------------------
+
+# Caches for the font objects and the rendered text surfaces, as the
+# same strings (e.g. the tile numbers) are drawn again in every frame.
+
+_FONT_CACHE_SIZE = 32
+_TEXT_CACHE_SIZE = 512
+
+def _colorKey(c):
+    """
+    Return the (r, g, b) tuple of c, an object of type color.Color,
+    to be used as a part of a cache key.
+    """
+    return (c.getRed(), c.getGreen(), c.getBlue())
+
+@functools.lru_cache(maxsize=_FONT_CACHE_SIZE)
+def _font(family, size, bold):
+    """
+    Return the pygame font with the given family, size and boldness.
+    """
+    return pygame.font.SysFont(family, size, bold)
+
+@functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def _renderText(s, family, size, bold, color):
+    """
+    Return the surface of string s rendered with the font given by
+    family, size and bold in the given (r, g, b) color. The returned
+    surface is shared, so it must not be modified.
+    """
+    return _font(family, size, bold).render(s, 1, pygame.Color(*color))
+
+def textCacheInfo():
+    """
+    Return the statistics (hits, misses, maxsize, currsize) of the
+    font cache and the rendered text cache as a pair.
+    """
+    return _font.cache_info(), _renderText.cache_info()
+
+def clearTextCache():
+    """
+    Remove all the fonts and the rendered texts from the caches.
+    """
+    _renderText.cache_clear()
+    _font.cache_clear()
+
+#-----------------------------------------------------------------------
+
 def picture(pic, x=None, y=None):
     """
     Draw pic on the background canvas centered at (x, y).  pic is an
@@ -530,6 +714,82 @@ def picture(pic, x=None, y=None):
     picSurface = pic._surface # violates encapsulation
     _surface.blit(picSurface, [xs-ws/2.0, ys-hs/2.0, ws, hs])
 
+#-----------------------------------------------------------------------
+
+# Functions to draw sprites, that is, offscreen surfaces drawn once by
+# using the drawing functions above and then copied onto the canvas.
+
+# The canvas surface and the scale saved while a sprite is being drawn
+_spriteState = None
+
+def beginSprite(x, y, w, h):
+    """
+    Start drawing a sprite that covers the rectangle of width w and
+    height h whose lower left point is (x, y). The subsequent drawing
+    is done on the sprite (with the same coordinates as on the
+    background canvas) until endSprite() is called.
+    """
+    global _surface
+    global _xmin
+    global _xmax
+    global _ymin
+    global _ymax
+    global _spriteState
+    _makeSureWindowCreated()
+    if _spriteState is not None:
+        raise Exception('A sprite is already being drawn')
+    rect = _pixelRect(x, y, w, h)
+    _spriteState = (_surface, _xmin, _xmax, _ymin, _ymax)
+    # shift the scale so that the rectangle starts at the top left
+    # corner of the sprite
+    dx = rect.x * (_xmax - _xmin) / _canvasWidth
+    dy = rect.y * (_ymax - _ymin) / _canvasHeight
+    _xmin, _xmax = _xmin + dx, _xmax + dx
+    _ymin, _ymax = _ymin - dy, _ymax - dy
+    _surface = pygame.Surface(rect.size)
+
+def endSprite():
+    """
+    Finish drawing the sprite started by beginSprite() and return it.
+    The subsequent drawing is done on the background canvas again.
+    """
+    global _surface
+    global _xmin
+    global _xmax
+    global _ymin
+    global _ymax
+    global _spriteState
+    if _spriteState is None:
+        raise Exception('No sprite is being drawn')
+    sprite = _surface
+    _surface, _xmin, _xmax, _ymin, _ymax = _spriteState
+    _spriteState = None
+    return sprite
+
+def sprite(s, x, y):
+    """
+    Draw sprite s (as returned by endSprite()) on the background
+    canvas centered at (x, y).
+    """
+    _makeSureWindowCreated()
+    xs = _scaleX(float(x))
+    ys = _scaleY(float(y))
+    _surface.blit(s, (xs - s.get_width() / 2.0, ys - s.get_height() / 2.0))
+
+def sprites(s, x, y):
+    """
+    Draw sprite s[i] on the background canvas centered at (x[i], y[i])
+    for each i.
+    """
+    _makeSureWindowCreated()
+    xs = np.broadcast_to(_scaleXs(x), (len(s),)).tolist()
+    ys = np.broadcast_to(_scaleYs(y), (len(s),)).tolist()
+    blits = [(si, (xi - si.get_width() / 2.0, yi - si.get_height() / 2.0))
+             for si, xi, yi in zip(s, xs, ys)]
+    _surface.blits(blits, False)
+
+#-----------------------------------------------------------------------
+
 def clear(c=WHITE):
     """
     Clear the background canvas to color c, where c is an
@@ -556,14 +816,50 @@ def save(f):
 
     pygame.image.save(_surface, f)
 
+def pixels():
+    """
+    Return the pixels of the background canvas as a NumPy array of
+    shape (width, height, 3) that is a view of the canvas, not a copy
+    (the first index is x and the second index is y, from the top
+    left corner). The canvas is locked while the array exists, so the
+    array must be deleted before drawing again.
+    """
+    import pygame.surfarray  # needs NumPy, so it is imported when used
+    _makeSureWindowCreated()
+    return pygame.surfarray.pixels3d(_surface)
+
 #-----------------------------------------------------------------------
 
 def _show():
     """
     Copy the background canvas to the window canvas.
     """
-    _background.blit(_surface, (0, 0))
-    pygame.display.flip()
+    if not _offscreen:
+        _background.blit(_surface, (0, 0))
+        pygame.display.flip()
+    _checkForEvents()
+
+def _pixelRect(x, y, w, h):
+    """
+    Return the pygame.Rect of the pixels covered by the rectangle of
+    width w and height h whose lower left point is (x, y).
+    """
+    x0 = math.floor(_scaleX(x))
+    y0 = math.floor(_scaleY(y + h))
+    x1 = math.ceil(_scaleX(x + w))
+    y1 = math.ceil(_scaleY(y))
+    return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+
+def _showRegions(regions):
+    """
+    Copy the given regions (pygame.Rect objects) of the background
+    canvas to the window canvas, updating only those parts of the
+    window.
+    """
+    if not _offscreen:
+        for rect in regions:
+            _background.blit(_surface, rect, rect)
+        pygame.display.update(regions)
     _checkForEvents()
 
 def _showAndWaitForever():
@@ -573,15 +869,15 @@ def _showAndWaitForever():
     """
     _makeSureWindowCreated()
     _show()
-    QUANTUM = .1
     while True:
-        time.sleep(QUANTUM)
-        _checkForEvents()
+        wait(float('inf'))
 
 def show(msec=float('inf')):
     """
     Copy the background canvas to the window canvas, and
     then wait for msec milliseconds. msec defaults to infinity.
+    The wait ends early when the user types a key or presses the
+    mouse (see wait()).
     """
     if msec == float('inf'):
         _showAndWaitForever()
@@ -589,19 +885,60 @@ def show(msec=float('inf')):
     _makeSureWindowCreated()
     _show()
     _checkForEvents()
+    wait(msec)
 
-    # Sleep for the required time, but check for events every
-    # QUANTUM seconds.
-    QUANTUM = .01
-    sec = msec / 1000.0
-    if sec < QUANTUM:
-        time.sleep(sec)
-        return
-    secondsWaited = 0.0
-    while secondsWaited < sec:
-        time.sleep(QUANTUM)
-        secondsWaited += QUANTUM
-        _checkForEvents()
+def showRegions(regions, msec=0.0):
+    """
+    Copy the given regions of the background canvas to the window
+    canvas, and then wait for msec milliseconds. Each region is a
+    tuple (x, y, w, h) that describes a rectangle of width w and
+    height h whose lower left point is (x, y). Only the given regions
+    of the window are updated, which is faster than show() when just
+    a small part of the drawing has changed.
+    """
+    _makeSureWindowCreated()
+    _showRegions([_pixelRect(x, y, w, h) for x, y, w, h in regions])
+    wait(msec)
+
+def wait(msec):
+    """
+    Wait for msec milliseconds while checking for events, without
+    copying the background canvas to the window canvas. The wait ends
+    early when a key is typed (or repeated) or the mouse is pressed.
+    Return the number of milliseconds actually waited.
+    """
+    global _timeWaited
+    _makeSureWindowCreated()
+    start = time.perf_counter()
+    deadline = start + msec / 1000.0
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        # Block on the event queue until the deadline or the next key
+        # repeat, so that no time is spent polling.
+        wakeTime = deadline
+        if _keysHeld:
+            wakeTime = min(wakeTime, min(_keysHeld.values()))
+        if wakeTime == float('inf'):
+            event = pygame.event.wait()
+        else:
+            event = pygame.event.wait(max(1, math.ceil((wakeTime - now) * 1000)))
+        inputReceived = False
+        if event.type != pygame.NOEVENT:
+            inputReceived = _handleEvent(event, time.perf_counter())
+        if _checkForEvents() or inputReceived:
+            break
+    waited = time.perf_counter() - start
+    _timeWaited += waited
+    return waited * 1000.0
+
+def timeWaited():
+    """
+    Return the total number of milliseconds spent in wait() (and thus
+    in show() and showRegions()) since the module was loaded.
+    """
+    return _timeWaited * 1000.0
 
 #-----------------------------------------------------------------------
 
@@ -649,10 +986,23 @@ def _checkForEvents():
     """
     Check if any new event has occured (such as a key typed or button
     pressed).  If a key has been typed, then put that key in a queue.
+    Return True if a key has been typed (or repeated) or the mouse has
+    been pressed, and False otherwise.
+    """
+    _makeSureWindowCreated()
+
+    now = time.perf_counter()
+    inputReceived = False
+    for event in pygame.event.get():
+        inputReceived = _handleEvent(event, now) or inputReceived
+    return _repeatKeysHeld(now) or inputReceived
+
+def _handleEvent(event, now):
+    """
+    Handle event, which occured at time now (a time.perf_counter()
+    value). Return True if the event is a key typed or a mouse button
+    pressed, and False otherwise.
     """
-    global _surface
-    global _keysTyped
-    
     #-------------------------------------------------------------------
     # Begin added by Alan J. Broder
     #-------------------------------------------------------------------
@@ -661,30 +1011,56 @@ def _checkForEvents():
     #-------------------------------------------------------------------
     # End added by Alan J. Broder
     #-------------------------------------------------------------------
-    
-    _makeSureWindowCreated()
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            sys.exit()
-        elif event.type == pygame.KEYDOWN:
-            _keysTyped = [pygame.key.name(event.key)] + _keysTyped
-        elif (event.type == pygame.MOUSEBUTTONUP) and \
-            (event.button == 3):
-            _saveToFile()
-            
-        #---------------------------------------------------------------
-        # Begin added by Alan J. Broder
-        #---------------------------------------------------------------
-        # Every time the mouse button is pressed, remember
-        # the mouse position as of that press.
-        elif (event.type == pygame.MOUSEBUTTONDOWN) and \
-            (event.button == 1): 
-            _mousePressed = True
-            _mousePos = event.pos                      
-        #---------------------------------------------------------------
-        # End added by Alan J. Broder
-        #---------------------------------------------------------------
+    if event.type == pygame.QUIT:
+        sys.exit()
+    elif event.type == pygame.KEYDOWN:
+        key = pygame.key.name(event.key)
+        _keysTyped.append((key, now))
+        if (_keyRepeat is not None) and (key in _keyRepeat[2]):
+            _keysHeld[key] = now + _keyRepeat[0]
+        return True
+    elif event.type == pygame.KEYUP:
+        _keysHeld.pop(pygame.key.name(event.key), None)
+    elif event.type == pygame.WINDOWFOCUSLOST:
+        # The key up events are not received without the focus.
+        _keysHeld.clear()
+    elif (event.type == pygame.MOUSEBUTTONUP) and \
+        (event.button == 3):
+        _saveToFile()
+
+    #-------------------------------------------------------------------
+    # Begin added by Alan J. Broder
+    #-------------------------------------------------------------------
+    # Every time the mouse button is pressed, remember
+    # the mouse position as of that press.
+    elif (event.type == pygame.MOUSEBUTTONDOWN) and \
+        (event.button == 1):
+        _mousePressed = True
+        _mousePos = event.pos
+        return True
+    #-------------------------------------------------------------------
+    # End added by Alan J. Broder
+    #-------------------------------------------------------------------
+    return False
+
+def _repeatKeysHeld(now):
+    """
+    Put the repeats of the keys held down that are due until time now
+    in the queue in the order of their times. Return True if any key
+    has been repeated, and False otherwise.
+    """
+    if not _keysHeld:
+        return False
+    repeats = []
+    for key, repeatTime in _keysHeld.items():
+        while repeatTime <= now:
+            repeats.append((key, repeatTime))
+            repeatTime += _keyRepeat[1]
+        _keysHeld[key] = repeatTime
+    repeats.sort(key=lambda keyTyped: keyTyped[1])
+    _keysTyped.extend(repeats)
+    return len(repeats) > 0
 
 #-----------------------------------------------------------------------
 
@@ -695,23 +1071,50 @@ def hasNextKeyTyped():
     Return True if the queue of the keys the user typed is not empty.
     Otherwise return False.
     """
-    global _keysTyped
-    return _keysTyped != []
+    return len(_keysTyped) > 0
 
 def nextKeyTyped():
     """
     Remove the first key from the queue of the keys that the user typed,
     and return that key.
     """
-    global _keysTyped
-    return _keysTyped.pop()
+    return _keysTyped.popleft()[0]
+
+def drainKeysTyped():
+    """
+    Remove all the keys from the queue of the keys that the user typed,
+    and return them as a list of (key, time) pairs in the order they
+    were typed. time is the time.perf_counter() value at which the key
+    was typed (or repeated).
+    """
+    keysTyped = list(_keysTyped)
+    _keysTyped.clear()
+    return keysTyped
 
 def clearKeysTyped():
     """
     Clear all the keys in the queue of the keys that the user typed.
     """
-    global _keysTyped
-    _keysTyped = []
+    _keysTyped.clear()
+
+def setKeyRepeat(delay=None, interval=None, keys=()):
+    """
+    Repeat each of the given keys while it is held down: the key is put
+    in the queue again delay milliseconds after it is typed and then
+    every interval milliseconds (delayed auto shift and auto repeat
+    rate). Calling this function without arguments turns off the key
+    repeat.
+    """
+    global _keyRepeat
+    _keysHeld.clear()
+    if delay is None:
+        _keyRepeat = None
+    else:
+        if interval is None:
+            interval = delay
+        if interval <= 0:
+            raise Exception('interval must be positive')
+        _keyRepeat = (delay / 1000.0, interval / 1000.0, frozenset(keys))
 
 #-----------------------------------------------------------------------
 # Begin added by Alan J. Broder
@@ -772,11 +1175,15 @@ pygame.font.init()
 #-----------------------------------------------------------------------
 
 # Functions for displaying Tkinter dialog boxes in child processes.
+# Tkinter is imported only by these child processes, so that it does
+# not slow down the start of the programs that use stddraw.
 
 def _getFileName():
     """
     Display a dialog box that asks the user for a file name.
     """
+    import tkinter as Tkinter
+    import tkinter.filedialog as tkFileDialog
     root = Tkinter.Tk()
     root.withdraw()
     reply = tkFileDialog.asksaveasfilename(initialdir='.')
@@ -788,6 +1195,8 @@ def _confirmFileSave():
     """
     Display a dialog box that confirms a file save operation.
     """
+    import tkinter as Tkinter
+    import tkinter.messagebox as tkMessageBox
     root = Tkinter.Tk()
     root.withdraw()
     tkMessageBox.showinfo(title='File Save Confirmation',
@@ -799,6 +1208,8 @@ def _reportFileSaveError(msg):
     Display a dialog box that reports a msg.  msg is a string which
     describes an error in a file save operation.
     """
+    import tkinter as Tkinter
+    import tkinter.messagebox as tkMessageBox
     root = Tkinter.Tk()
     root.withdraw()
     tkMessageBox.showerror(title='File Save Error', message=msg)
@@ -1,4 +1,103 @@
 import os
+import json
+import atexit
+import threading
+import time
+
+# the directory of the save files (next to this python code file)
+SAVE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "save")
+# the save file and the save file of the older versions (four lines with the
+# difficulty, the high score, the volume and the music on-off setting)
+SAVE_FILE = os.path.join(SAVE_DIR, "save.json")
+LEGACY_SAVE_FILE = os.path.join(SAVE_DIR, "save.save")
+# the version of the format of the save file
+SAVE_VERSION = 1
+
+# A class for writing the save file on a background thread so that saving never
+# blocks the game. The data given while a write is pending replaces the pending
+# data (only the last one is written), and each write goes to a temporary file
+# that is flushed to the disk and then renamed over the save file, so the save
+# file always has either the old or the new data.
+class SaveWriter:
+
+    # the time to wait for more changes before writing (in seconds)
+    coalesce_delay = 0.2
+
+    def __init__(self, path):
+        self.path = path
+        self.condition = threading.Condition()
+        # the data waiting to be written (None if there is nothing to write)
+        self.pending = None
+        # whether a write is in progress and whether the pending data is
+        # needed to be written right away
+        self.writing, self.flushing = False, False
+        self.thread = None
+
+    # Schedules the given data to be written (replacing the pending data)
+    def submit(self, data):
+        with self.condition:
+            self.pending = data
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="SaveWriter", daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    # Waits until all the submitted data is written
+    def flush(self):
+        with self.condition:
+            # the pending data is written without waiting for more changes
+            self.flushing = True
+            self.condition.notify_all()
+            while self.pending is not None or self.writing:
+                self.condition.wait()
+            self.flushing = False
+
+    # The loop of the background thread
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None:
+                    self.condition.wait()
+                # wait a little for more changes (e.g., a few volume clicks)
+                deadline = time.monotonic() + SaveWriter.coalesce_delay
+                while not self.flushing and time.monotonic() < deadline:
+                    self.condition.wait(deadline - time.monotonic())
+                data, self.pending = self.pending, None
+                self.writing = True
+            try:
+                self.write(data)
+            except OSError:
+                # the data is written again with the next change
+                pass
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
+
+    # Writes the given data to the save file atomically
+    def write(self, data):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as temp_file:
+            json.dump(data, temp_file)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, self.path)
+        # make the rename itself durable (not supported on every platform)
+        try:
+            dir_fd = os.open(os.path.dirname(self.path), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+# the writer shared by all the players (the pending data is written before the
+# program exits)
+save_writer = SaveWriter(SAVE_FILE)
+atexit.register(save_writer.flush)
 
 class Player:
 
@@ -6,42 +105,85 @@ class Player:
     high_score = 0
     volume = 50
     music_on = True
-    save_list = []
 
     def __init__(self):
-        # get the directory in which this python code file is placed
-        current_dir = os.path.dirname(os.path.realpath(__file__))
-        # compute the path of the image file
-        save_file_location = current_dir + "/save/save.save"
-        # Import values from save file to list
-        save_file = open(save_file_location, "r")
-        self.save_list = save_file.readlines()
-        save_file.close()
-        # Importing difficulty
-        if (int(self.save_list[0]) == 1):
-            self.difficulty = 1
-        elif (int(self.save_list[0]) == 2):
-            self.difficulty = 2
-        # Importing high score
-        self.high_score = int(self.save_list[1])
-        # Importing music volume
-        self.volume = int(self.save_list[2])
-        # Importing music on-off setting
-        # 0 represents false, 1 represents True
-        if (int(self.save_list[3]) == 0):
-            self.music_on = False
+        # Import values from the save file, or from the save file of the older
+        # versions (saved again in the current format) if there is no save file
+        # (the default values are used when neither file can be read)
+        data = self.readSaveFile(SAVE_FILE)
+        if data is not None:
+            self.importData(data)
+            return
+        data = self.readLegacySaveFile(LEGACY_SAVE_FILE)
+        if data is not None:
+            self.importData(data)
+            self.save()
+
+    # Returns the data in the save file with the given path (None if the file
+    # is missing or corrupted)
+    def readSaveFile(self, path):
+        try:
+            with open(path, "r") as save_file:
+                data = json.load(save_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("version"), int):
+            return None
+        return data
+
+    # Returns the data in the save file of the older versions with the given
+    # path (None if the file is missing or corrupted)
+    def readLegacySaveFile(self, path):
+        try:
+            with open(path, "r") as save_file:
+                values = [int(line) for line in save_file.read().split()]
+        except (OSError, ValueError):
+            return None
+        if len(values) < 4:
+            return None
+        # 0 represents false, 1 represents True for the music on-off setting
+        return {"version": 0, "difficulty": values[0], "high_score": values[1],
+                "volume": values[2], "music_on": values[3] != 0}
+
+    # Imports the valid values in the given data (the others keep their
+    # default values)
+    def importData(self, data):
+        difficulty = data.get("difficulty")
+        if isinstance(difficulty, int) and difficulty in (0, 1, 2):
+            self.difficulty = difficulty
+        high_score = data.get("high_score")
+        if isinstance(high_score, int) and high_score >= 0:
+            self.high_score = high_score
+        volume = data.get("volume")
+        if isinstance(volume, int) and 0 <= volume <= 100:
+            self.volume = volume
+        music_on = data.get("music_on")
+        if isinstance(music_on, bool):
+            self.music_on = music_on
+
+    # Returns the data to be written to the save file
+    def exportData(self):
+        return {"version": SAVE_VERSION, "difficulty": self.difficulty,
+                "high_score": self.high_score, "volume": self.volume,
+                "music_on": self.music_on}
+
+    # Saves the settings and the high score in the background
+    def save(self):
+        save_writer.submit(self.exportData())
 
     def getDiff(self):
         return self.difficulty
 
     def setDiff(self, number):
         self.difficulty = number
+        self.save()
 
     def getHighScore(self):
         return self.high_score
 
     def setHighScore(self, number):
         self.high_score = number
+        self.save()
 
     def getVolume(self):
         return self.volume
@@ -49,37 +191,29 @@ class Player:
     def setVolume(self, number):
         if (number >= 0 and number <= 100):
             self.volume = number
+            self.save()
 
     def increaseVolume(self, number=1):
         if (self.volume + number <= 100):
             self.volume += number
+            self.save()
 
     def decreaseVolume(self, number=1):
         if (self.volume - number >= 0):
             self.volume -= number
+            self.save()
 
     def getMusicCondition(self):
         return self.music_on
 
     def turnMusicOn(self):
         self.music_on = True
+        self.save()
 
     def turnMusicOff(self):
         self.music_on = False
+        self.save()
 
-    # Writes changed settings into the file
+    # Writes changed settings into the file (in the background)
     def updateOnClose(self):
-        # get the directory in which this python code file is placed
-        current_dir = os.path.dirname(os.path.realpath(__file__))
-        # compute the path of the image file
-        save_file_location = current_dir + "/save/save.save"
-        # Import values to save file from Player object
-        save_file = open(save_file_location, "w")
-        save_file.write(str(self.difficulty) + "\n")
-        save_file.write(str(self.high_score) + "\n")
-        save_file.write(str(self.volume) + "\n")
-        if (self.music_on):
-            save_file.write("1")
-        else:
-            save_file.write("0")
-        save_file.close()
+        self.save()
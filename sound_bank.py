@@ -0,0 +1,67 @@
+from assets import assets  # used for loading the sound files
+import pygame as pg  # used for playing the sounds
+import threading  # used for starting the bank on a background thread as well
+
+# A class for modeling a bank of the sound effects of the game. All the effects
+# are decoded once when the mixer is started and they are played on a fixed
+# pool of channels reserved for the effects, with the volume of the player set
+# on the channel (so the sounds themselves are never changed).
+class SoundBank:
+   # the relative paths of the sound files of the effects by their names
+   effects = {
+      "click": "sounds/tetris-click-sound.wav",
+      "game_over": "sounds/tetris-game-over.wav",
+   }
+   # the number of the channels reserved for the effects
+   channel_count = 4
+
+   # A constructor for creating a sound bank that loads the effects by using
+   # the given asset manager
+   def __init__(self, asset_manager):
+      self.assets = asset_manager
+      # the decoded sounds of the effects by their names
+      self.sounds = {}
+      # the reserved channels (empty until the bank is started)
+      self.channels = []
+      # the index of the channel to be taken over when all of them are busy
+      self.next_channel = 0
+      # the lock that is held while the bank is started (it may be started on
+      # a background thread at startup)
+      self.lock = threading.Lock()
+
+   # A method for starting the mixer, reserving the channels and decoding all
+   # the effects (only once)
+   def start(self):
+      with self.lock:
+         if self.channels:
+            return
+         self.assets.init_mixer()
+         count = SoundBank.channel_count
+         if pg.mixer.get_num_channels() < count:
+            pg.mixer.set_num_channels(count)
+         # the reserved channels are not used by pygame for other sounds
+         pg.mixer.set_reserved(count)
+         for name, path in SoundBank.effects.items():
+            self.sounds[name] = self.assets.get_sound(path)
+         self.channels = [pg.mixer.Channel(index) for index in range(count)]
+
+   # A method that returns an idle reserved channel, or the reserved channels
+   # one after another when all of them are busy
+   def get_channel(self):
+      for channel in self.channels:
+         if not channel.get_busy():
+            return channel
+      channel = self.channels[self.next_channel]
+      self.next_channel = (self.next_channel + 1) % len(self.channels)
+      return channel
+
+   # A method for playing the effect with the given name once with the given
+   # volume (from 0 to 100)
+   def play(self, name, volume):
+      self.start()
+      channel = self.get_channel()
+      channel.set_volume(volume / 100)
+      channel.play(self.sounds[name])
+
+# the sound bank shared by all the modules of the game
+sound_bank = SoundBank(assets)
@@ -0,0 +1,44 @@
+import sys  # used for printing the report
+import time  # used for measuring the phases of the startup
+
+# A class for modeling a trace of the startup of the program as the times of
+# its phases (imports, initializations, ...) up to the first displayed frame
+class StartupTrace:
+   # A constructor for creating a trace that starts at the current time
+   def __init__(self):
+      self.start_time = self.last_time = time.perf_counter()
+      # the names and the durations (in milliseconds) of the traced phases
+      self.phases = []
+      # whether the report is printed when the trace is finished
+      self.enabled = False
+      self.finished = False
+
+   # A method for recording the end of the phase with the given name (the
+   # phase started at the end of the previous phase)
+   def mark(self, name):
+      if self.finished:
+         return
+      now = time.perf_counter()
+      self.phases.append((name, (now - self.last_time) * 1000))
+      self.last_time = now
+
+   # A method for recording the end of the last phase with the given name and
+   # printing the report if the trace is enabled (only the first call counts)
+   def finish(self, name, extra_report=None):
+      if self.finished:
+         return
+      self.mark(name)
+      self.finished = True
+      if self.enabled:
+         print(self.get_report(), file=sys.stderr)
+         if extra_report:
+            print(extra_report, file=sys.stderr)
+
+   # A method that returns the report of the traced phases
+   def get_report(self):
+      lines = ["%8.2f ms  %s" % (msec, name) for name, msec in self.phases]
+      lines.append("%8.2f ms  total" % ((self.last_time - self.start_time) * 1000))
+      return "\n".join(lines)
+
+# the trace of the startup of the game (started when this module is imported)
+startup_trace = StartupTrace()
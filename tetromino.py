@@ -1,88 +1,81 @@
 from tile import Tile  # used for modeling each tile on the tetrominoes
 from point import Point  # used for tile positions
-import copy as cp  # the copy module is used for copying tiles and positions
-import random  # the random module is used for generating random values
+import random  # used when no random number generator is given
 import numpy as np  # the fundamental Python module for scientific computing
 
-# A class for modeling tetrominoes with 3 out of 7 different types as I, O and Z
+# A class for modeling a rotation state of a tetromino type with the occupied
+# cells of its tile matrix and the contours used for collision checks
+class RotationState:
+   # A constructor for creating a rotation state from the given occupied cells
+   # (column_index, row_index) of an n x n tile matrix
+   def __init__(self, n, occupied_cells):
+      self.n = n
+      self.cells = occupied_cells
+      rows = [row for _, row in occupied_cells]
+      cols = [col for col, _ in occupied_cells]
+      # the bounds of the occupied cells in the tile matrix
+      self.min_row, self.max_row = min(rows), max(rows)
+      self.min_col, self.max_col = min(cols), max(cols)
+      # the leftmost and the rightmost cell of each row and the bottommost cell
+      # of each column (the cells checked when moving left, right and down)
+      self.left_cells = [(min(c for c, r in occupied_cells if r == row), row) for row in set(rows)]
+      self.right_cells = [(max(c for c, r in occupied_cells if r == row), row) for row in set(rows)]
+      self.bottom_cells = [(col, max(r for c, r in occupied_cells if c == col)) for col in set(cols)]
+      # the bottom profile as the height of the bottommost cell of each column
+      # above the bottom left cell of the tile matrix
+      self.bottom_profile = [(col, n - 1 - row) for col, row in self.bottom_cells]
+
+   # A method that returns the next rotation state (rotated clockwise by 90
+   # degrees), keeping the order of the cells so that each tile keeps its index
+   def rotated(self):
+      n = self.n
+      return RotationState(n, [(n - 1 - row, col) for col, row in self.cells])
+
+# A class for modeling tetrominoes with 7 different types as I, O, Z, L, J, S and T
 class Tetromino:
    # the dimensions of the game grid (defined as class variables)
    grid_height, grid_width = None, None
+   # the size n of the tile matrix and the occupied cells (column_index,
+   # row_index) of each tetromino type in its initial rotation state
+   shapes = {
+      'I': (4, [(1, 0), (1, 1), (1, 2), (1, 3)]),
+      'O': (2, [(0, 0), (1, 0), (0, 1), (1, 1)]),
+      'Z': (3, [(0, 1), (1, 1), (1, 2), (2, 2)]),
+      'L': (3, [(1, 0), (1, 1), (1, 2), (2, 2)]),
+      'J': (3, [(1, 0), (1, 1), (1, 2), (0, 2)]),  # represents reverse L
+      'S': (3, [(2, 1), (1, 1), (1, 2), (0, 2)]),  # represents reverse Z
+      'T': (3, [(0, 1), (1, 1), (2, 1), (1, 2)]),
+   }
+   # the four rotation states of each tetromino type (computed once below)
+   rotation_states = {}
 
-   # A constructor for creating a tetromino with a given shape (type)
-   def __init__(self, shape):
+   # A constructor for creating a tetromino with a given shape (type), using
+   # the given random number generator of the game (a GameRandom) for its
+   # column and the numbers on its tiles (or the random module when rng is not
+   # given)
+   def __init__(self, shape, rng=None):
       self.type = shape  # set the type of this tetromino
+      # the index of the current rotation state of this tetromino
       self.rotate_count = 0
-      # determine the occupied (non-empty) cells in the tile matrix based on
-      # the shape of this tetromino (see the documentation given with this code)
-      occupied_cells = []
-      if self.type == 'I':
-         n = 4  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino I in its initial rotation state
-         occupied_cells.append((1, 0))  # (column_index, row_index)
-         occupied_cells.append((1, 1))
-         occupied_cells.append((1, 2))
-         occupied_cells.append((1, 3))
-      elif self.type == 'O':
-         n = 2  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino O in its initial rotation state
-         occupied_cells.append((0, 0))  # (column_index, row_index)
-         occupied_cells.append((1, 0))
-         occupied_cells.append((0, 1))
-         occupied_cells.append((1, 1))
-      elif self.type == 'Z':
-         n = 3  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino Z in its initial rotation state
-         occupied_cells.append((0, 1))  # (column_index, row_index)
-         occupied_cells.append((1, 1))
-         occupied_cells.append((1, 2))
-         occupied_cells.append((2, 2))
-      elif self.type == 'L':
-         n = 3  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino L in its initial rotation state
-         occupied_cells.append((1, 0))  # (column_index, row_index)
-         occupied_cells.append((1, 1))
-         occupied_cells.append((1, 2))
-         occupied_cells.append((2, 2))
-      elif self.type == 'J': # Represents reverse L
-         n = 3  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino reverse L in its initial rotation state
-         occupied_cells.append((1, 0))  # (column_index, row_index)
-         occupied_cells.append((1, 1))
-         occupied_cells.append((1, 2))
-         occupied_cells.append((0, 2))
-      elif self.type == 'S': # Respresents reverse Z
-         n = 3  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino reverse Z in its initial rotation state
-         occupied_cells.append((2, 1))  # (column_index, row_index)
-         occupied_cells.append((1, 1))
-         occupied_cells.append((1, 2))
-         occupied_cells.append((0, 2))
-      elif self.type == 'T':
-         n = 3  # n = number of rows = number of columns in the tile matrix
-         # shape of the tetromino T in its initial rotation state
-         occupied_cells.append((0, 1))  # (column_index, row_index)
-         occupied_cells.append((1, 1))
-         occupied_cells.append((2, 1))
-         occupied_cells.append((1, 2))
-      # create a matrix of numbered tiles based on the shape of this tetromino
-      self.tile_matrix = np.full((n, n), None)
-      # create the four tiles (minos) of this tetromino and place these tiles
-      # into the tile matrix
-      for i in range(len(occupied_cells)):
-         col_index, row_index = occupied_cells[i][0], occupied_cells[i][1]
-         # create a tile for each occupied cell of this tetromino
-         self.tile_matrix[row_index][col_index] = Tile()
+      n, occupied_cells = Tetromino.shapes[self.type]
+      # create the four tiles (minos) of this tetromino, the tile with index i
+      # is placed on the i-th occupied cell of the current rotation state
+      self.tiles = [Tile(rng=rng) for _ in occupied_cells]
       # initialize the position of this tetromino (as the bottom left cell in
       # the tile matrix) with a random horizontal position above the game grid
       self.bottom_left_cell = Point()
       self.bottom_left_cell.y = Tetromino.grid_height - 1
-      self.bottom_left_cell.x = random.randint(0, Tetromino.grid_width - n)
+      columns = random if rng is None else rng.spawn_columns
+      self.bottom_left_cell.x = columns.randint(0, Tetromino.grid_width - n)
+
+   # A method that returns the current rotation state of this tetromino
+   def get_rotation_state(self):
+      return Tetromino.rotation_states[self.type][self.rotate_count]
 
    # A method that computes and returns the position of the cell in the tile
    # matrix specified by the given row and column indexes
    def get_cell_position(self, row, col):
-      n = len(self.tile_matrix)  # n = number of rows = number of columns
+      n = self.get_rotation_state().n  # n = number of rows = number of columns
       position = Point()
       # horizontal position of the cell
       position.x = self.bottom_left_cell.x + col
@@ -90,67 +83,29 @@ class Tetromino:
       position.y = self.bottom_left_cell.y + (n - 1) - row
       return position
 
-   # A method to return a copy of the tile matrix without any empty row/column,
-   # and the position of the bottom left cell when return_position is set
+   # A method to return the tile matrix without any empty row/column, and the
+   # position of the bottom left cell when return_position is set. The tiles
+   # are not copied, they are handed over to the returned matrix (as done when
+   # the tetromino is locked on the game grid).
    def get_min_bounded_tile_matrix(self, return_position=False):
-      n = len(self.tile_matrix)  # n = number of rows = number of columns
-      # determine rows and columns to copy (omit empty rows and columns)
-      min_row, max_row, min_col, max_col = n - 1, 0, n - 1, 0
-      for row in range(n):
-         for col in range(n):
-            if self.tile_matrix[row][col] is not None:
-               if row < min_row:
-                  min_row = row
-               if row > max_row:
-                  max_row = row
-               if col < min_col:
-                  min_col = col
-               if col > max_col:
-                  max_col = col
-      # copy the tiles from the tile matrix of this tetromino
-      copy = np.full((max_row - min_row + 1, max_col - min_col + 1), None)
-      for row in range(min_row, max_row + 1):
-         for col in range(min_col, max_col + 1):
-            if self.tile_matrix[row][col] is not None:
-               row_ind = row - min_row
-               col_ind = col - min_col
-               copy[row_ind][col_ind] = cp.deepcopy(self.tile_matrix[row][col])
-      # return just the matrix copy when return_position is not set (as True)
+      state = self.get_rotation_state()
+      n = state.n  # n = number of rows = number of columns
+      # the rows and columns to keep (omitting empty rows and columns)
+      min_row, max_row = state.min_row, state.max_row
+      min_col, max_col = state.min_col, state.max_col
+      # place the tiles of this tetromino into the matrix
+      matrix = np.full((max_row - min_row + 1, max_col - min_col + 1), None)
+      for tile, (col, row) in zip(self.tiles, state.cells):
+         matrix[row - min_row][col - min_col] = tile
+      # return just the matrix when return_position is not set (as True)
       # the argument return_position defaults to False when a value is not given
       if not return_position:
-         return copy
-      # otherwise return the position of the bottom left cell in copy as well
-      else:
-         blc_position = cp.copy(self.bottom_left_cell)
-         blc_position.translate(min_col, (n - 1) - max_row)
-         return copy, blc_position
-
-   # A method for drawing the tetromino on the game grid
-   def draw(self):
-      n = len(self.tile_matrix)  # n = number of rows = number of columns
-      for row in range(n):
-         for col in range(n):
-            # draw each occupied cell as a tile on the game grid
-            if self.tile_matrix[row][col] is not None:
-               # get the position of the tile
-               position = self.get_cell_position(row, col)
-               # draw only the tiles that are inside the game grid
-               if position.y < Tetromino.grid_height:
-                  self.tile_matrix[row][col].draw(position)
-
-   # Method for drawing upcoming tetrominoes on the blank space right next to the game grid
-   def draw_outside(self):
-      n = len(self.tile_matrix)
-      if (self.type == 'O'):
-         position_x, position_y = 14, 3.5 # Optimizing drawing function for square because it's matrix has only 4 elements.
+         return matrix
+      # otherwise return the position of the bottom left cell in matrix as well
       else:
-         position_x, position_y = 13.5, 4
-      for row in range(n):
-         for col in range(n):
-            if self.tile_matrix[row][col] is not None:
-                  # Get the position for each tile relative to the provided position
-                  tile_position = Point(position_x + col, position_y - row)
-                  self.tile_matrix[row][col].draw(tile_position)
+         blc_position = Point(self.bottom_left_cell.x + min_col,
+                              self.bottom_left_cell.y + (n - 1) - max_row)
+         return matrix, blc_position
 
    # A method for moving this tetromino in a given direction by 1 on the grid
    def move(self, direction, game_grid):
@@ -167,105 +122,67 @@ class Tetromino:
          self.bottom_left_cell.y -= 1
       return True  # a successful move in the given direction
 
+   # A method for dropping this tetromino down to where it lands on the grid
+   def hard_drop(self, game_grid):
+      landing_y = game_grid.get_landing_row(self.type, self.rotate_count, self.bottom_left_cell.x)
+      self.bottom_left_cell.y = min(self.bottom_left_cell.y, landing_y)
+
    # A method for checking if this tetromino can be moved in a given direction
+   # by looking up the grid cells next to the precomputed contour cells
    def can_be_moved(self, direction, game_grid):
-      n = len(self.tile_matrix)  # n = number of rows = number of columns
-      # check for moving left or right
-      if direction == "left" or direction == "right":
-         for row_index in range(n):
-            for col_index in range(n):
-               # direction = left --> check the leftmost tile of each row
-               row, col = row_index, col_index
-               if direction == "left" and self.tile_matrix[row][col] is not None:
-                  # the position of the leftmost tile of the current row
-                  leftmost = self.get_cell_position(row, col)
-                  # if any leftmost tile is at x = 0
-                  if leftmost.x == 0:
-                     return False  # this tetromino cannot be moved left
-                  # if the grid cell on the left of a leftmost tile is occupied
-                  if game_grid.is_occupied(leftmost.y, leftmost.x - 1):
-                     return False  # this tetromino cannot be moved left
-                  # as the leftmost tile of the current row is checked
-                  break  # end the inner for loop
-               # direction = right --> check the rightmost tile of each row
-               row, col = row_index, n - 1 - col_index
-               if direction == "right" and self.tile_matrix[row][col] is not None:
-                  # the position of the rightmost tile of the current row
-                  rightmost = self.get_cell_position(row, col)
-                  # if any rightmost tile is at x = grid_width - 1
-                  if rightmost.x == Tetromino.grid_width - 1:
-                     return False  # this tetromino cannot be moved right
-                  # if the grid cell on the right of a rightmost tile is occupied
-                  if game_grid.is_occupied(rightmost.y, rightmost.x + 1):
-                     return False  # this tetromino cannot be moved right
-                  # as the rightmost tile of the current row is checked
-                  break  # end the inner for loop
+      state = self.get_rotation_state()
+      # the position of the top left cell of the tile matrix
+      left_x = self.bottom_left_cell.x
+      top_y = self.bottom_left_cell.y + state.n - 1
+      # direction = left --> check the leftmost tile of each row
+      if direction == "left":
+         for col, row in state.left_cells:
+            x, y = left_x + col - 1, top_y - row
+            # if the leftmost tile is at x = 0 or the cell on its left is occupied
+            if x < 0 or game_grid.is_occupied(y, x):
+               return False  # this tetromino cannot be moved left
+      # direction = right --> check the rightmost tile of each row
+      elif direction == "right":
+         for col, row in state.right_cells:
+            x, y = left_x + col + 1, top_y - row
+            # if the rightmost tile is at x = grid_width - 1 or the cell on its
+            # right is occupied
+            if x >= Tetromino.grid_width or game_grid.is_occupied(y, x):
+               return False  # this tetromino cannot be moved right
       # direction = down --> check the bottommost tile of each column
       else:
-         for col in range(n):
-            for row in range(n - 1, -1, -1):
-               # if the current cell of the tetromino is occupied by a tile
-               if self.tile_matrix[row][col] is not None:
-                  # the position of the bottommost tile of the current col
-                  bottommost = self.get_cell_position(row, col)
-                  # if any bottommost tile is at y = 0
-                  if bottommost.y == 0:
-                     return False  # this tetromino cannot be moved down
-                  # if the grid cell below any bottommost tile is occupied
-                  if game_grid.is_occupied(bottommost.y - 1, bottommost.x):
-                     return False  # this tetromino cannot be moved down
-                  # as the bottommost tile of the current row is checked
-                  break  # end the inner for loop
+         for col, row in state.bottom_cells:
+            x, y = left_x + col, top_y - row - 1
+            # if the bottommost tile is at y = 0 or the cell below is occupied
+            if y < 0 or game_grid.is_occupied(y, x):
+               return False  # this tetromino cannot be moved down
       # if this method does not end by returning False before this line
       return True  # this tetromino can be moved in the given direction
 
-   # A method to check a tetromino can be rotated or not.
+   # A method to check a tetromino can be rotated or not, that is, whether all
+   # the cells of the next rotation state are inside the game grid (above the
+   # grid is allowed) and not occupied
    def can_be_rotated(self, game_grid):
-      n = len(self.tile_matrix)
-      # Handling x-axis collisions
-      for row_index in range(n):
-            for col_index in range(n):
-               # Handling left-side collisions
-               row, col = row_index, col_index
-               leftmost = self.get_cell_position(row, col)
-               if leftmost.x < 0:
-                  return False
-               if game_grid.is_occupied(leftmost.y, leftmost.x):
-                     return False
-               # Handling right-side collisions
-               row, col = row_index, n - 1 - col_index
-               rightmost = self.get_cell_position(row, col)
-               if rightmost.x > Tetromino.grid_width - 1:
-                     return False
-               if game_grid.is_occupied(rightmost.y, rightmost.x):
-                     return False
-      # Handling y-axis collisions
-      for col in range(n):
-            for row in range(n - 1, -1, -1):
-               # Handling bottom collisions
-               bottommost = self.get_cell_position(row, col)
-               if bottommost.y < 0:
-                     return False
-               if game_grid.is_occupied(bottommost.y, bottommost.x):
-                     return False
-               # Handling upper collisions
-               upmost = self.get_cell_position(n - 1 - row, col)
-               # There is no need to check upper-side collisions with grid because tetrominos are already moving down.
-               # Only checking tetromino-tetromino collisions
-               if game_grid.is_occupied(upmost.y, upmost.x):
-                     return False
+      next_state = Tetromino.rotation_states[self.type][(self.rotate_count + 1) % 4]
+      left_x = self.bottom_left_cell.x
+      top_y = self.bottom_left_cell.y + next_state.n - 1
+      for col, row in next_state.cells:
+         x, y = left_x + col, top_y - row
+         if x < 0 or x >= Tetromino.grid_width or y < 0:
+            return False
+         if game_grid.is_occupied(y, x):
+            return False
       return True
 
    # A method to rotate a tetromino
    def rotate(self, game_grid): # Rotates the tetromino once by clock-wise.
       if (self.can_be_rotated(game_grid)):
-         n = len(self.tile_matrix)
-         # Rotating the shape clock-wise by 90 degrees
-         self.tile_matrix = np.flip(np.transpose(self.tile_matrix), axis=1)
-         # Handling rotate count
-         if (self.rotate_count == 3):
-            self.rotate_count = 0
-         else:
-            self.rotate_count += 1
-
+         # Moving to the next rotation state
+         self.rotate_count = (self.rotate_count + 1) % 4
 
+# compute the four rotation states of each tetromino type once at import
+for shape, (n, occupied_cells) in Tetromino.shapes.items():
+   states = [RotationState(n, occupied_cells)]
+   for _ in range(3):
+      states.append(states[-1].rotated())
+   Tetromino.rotation_states[shape] = states
@@ -1,66 +1,63 @@
-import lib.stddraw as stddraw  # used for drawing the tiles to display them
 from lib.color import Color  # used for coloring the tiles
-import random as rd
-from point import Point
+import random as rd  # used when no random number generator is given
 
 
 # A class for modeling numbered tiles as in 2048
 class Tile:
+   # a tile only stores its number, its colors come from the palette below
+   __slots__ = ('number',)
    # Class variables shared among all Tile objects
    # ---------------------------------------------------------------------------
    # the value of the boundary thickness (for the boxes around the tiles)
    boundary_thickness = 0.002
    # font family and font size used for displaying the tile number
    font_family, font_size = "Arial", 14
-
-   # A constructor that creates a tile with 2 or 4 (with 50% probability) as the number on it
-   def __init__(self):
+   # the palette of background (tile) colors for each tile number, shared by
+   # all the tiles with the same number (larger numbers use the color of 2048)
+   background_colors = {
+      2: Color(238, 228, 218),  # lightgray
+      4: Color(236, 224, 200),  # lightblue
+      8: Color(243, 177, 121),  # orange
+      16: Color(245, 149, 99),  # coral
+      32: Color(246, 124, 95),  # red
+      64: Color(246, 94, 59),  # purple
+      128: Color(237, 207, 114),  # green
+      256: Color(237, 204, 97),  # blue
+      512: Color(237, 200, 80),  # etc.
+      1024: Color(237, 197, 63),
+      2048: Color(237, 194, 46),
+   }
+   foreground_color = Color(138, 129, 120)  # foreground (number) color
+   box_color = Color(156, 146, 136)  # box (boundary) color
+
+   # A constructor that creates a tile with the given number on it, or with
+   # 2 or 4 (with 50% probability) when no number is given, chosen by using the
+   # tile values stream of the given random number generator of the game (a
+   # GameRandom) or the random module when rng is not given
+   def __init__(self, number=None, rng=None):
 
       # set the number on this tile
-      if (rd.random() < 0.5):
+      if number is not None:
+         self.number = number
+      elif ((rd if rng is None else rng.tile_values).random() < 0.5):
          self.number = 2
       else:
          self.number = 4
 
-      # set the colors of this tile
-      if (self.number == 2):
-         self.background_color = Color(238, 228, 218) # background (tile) color
-         self.foreground_color = Color(138, 129, 120)  # foreground (number) color
-      elif (self.number == 4):
-         self.background_color = Color(236, 224, 200)
-         self.foreground_color = Color(138, 129, 120)
-      else:
-         self.background_color = Color(236, 224, 200)
-         self.foreground_color = Color(138, 129, 120)
-      self.box_color = Color(156, 146, 136) # box (boundary) color
-
-      self.position = Point()
+   # The background color of this tile taken from the palette by its number
+   @property
+   def background_color(self):
+      colors = Tile.background_colors
+      return colors[self.number] if self.number in colors else colors[2048]
 
-   def move(self, dx, dy):
-      self.position.x += dx
-      self.position.y += dy
-
-   # A method for drawing this tile at a given position with a given length
-   def draw(self, position, length=1):  # length defaults to 1
-      # draw the tile as a filled square
-      stddraw.setPenColor(self.background_color)
-      stddraw.filledSquare(position.x, position.y, length / 2)
-      # draw the bounding box around the tile as a square
-      stddraw.setPenColor(self.box_color)
-      stddraw.setPenRadius(Tile.boundary_thickness)
-      stddraw.square(position.x, position.y, length / 2)
-      stddraw.setPenRadius()  # reset the pen radius to its default value
-      # draw the number on the tile
-      stddraw.setPenColor(self.foreground_color)
-      stddraw.setFontFamily(Tile.font_family)
-      stddraw.setFontSize(Tile.font_size)
-      stddraw.text(position.x, position.y, str(self.number))
-
-   # Setter for number property
+   # Setter for number property (the colors follow the number via the palette)
    def setNumber(self, number):
       self.number = number
-      # Numara değiştirildiğinde background_color ve foreground_color değişkenlerinin de değiştirilmesi gerekiyor bu metod içinde.
 
    # Getter for number property
    def getNumber(self):
       return self.number
+
+   # Returns the log2 of the number on this tile (as stored on the game grid)
+   def getExponent(self):
+      return self.number.bit_length() - 1
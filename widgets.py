@@ -0,0 +1,213 @@
+import lib.stddraw as stddraw  # used for drawing the widgets
+import math  # used for finding the cells of the hit-test index
+
+# A class for modeling a rectangular widget (a part of a menu) with the given
+# bottom left corner (x, y), width and height
+class Widget:
+   # A constructor for creating a widget covering the given region
+   def __init__(self, x, y, width, height):
+      self.x, self.y = x, y
+      self.width, self.height = width, height
+      # the menu that the widget is added to (set by the menu)
+      self.menu = None
+
+   # A method that returns the region (x, y, width, height) drawn by the widget
+   def get_region(self):
+      return self.x, self.y, self.width, self.height
+
+   # A method that returns the region (x, y, width, height) that responds to
+   # clicks (None when the widget cannot be clicked)
+   def get_hit_region(self):
+      return None
+
+   # A method for checking whether the point (x, y) is inside the hit region
+   def contains(self, x, y):
+      region = self.get_hit_region()
+      if region is None:
+         return False
+      region_x, region_y, width, height = region
+      return region_x <= x <= region_x + width and region_y <= y <= region_y + height
+
+   # A method that marks the widget to be drawn again by its menu
+   def invalidate(self):
+      if self.menu is not None:
+         self.menu.invalidate(self)
+
+   # A method for drawing the widget (overridden by the subclasses)
+   def draw(self):
+      pass
+
+# A class for modeling a text centered on its region
+class Label(Widget):
+   # A constructor for creating a label with the given text, text color and
+   # font size
+   def __init__(self, x, y, width, height, text, text_color, font_size=25):
+      Widget.__init__(self, x, y, width, height)
+      self.text = text
+      self.text_color = text_color
+      self.font_size = font_size
+
+   # A method for changing the text of the label (it is drawn again only when
+   # the text is changed)
+   def set_text(self, text):
+      if text != self.text:
+         self.text = text
+         self.invalidate()
+
+   # A method for drawing the text of the label
+   def draw(self):
+      stddraw.setPenColor(self.text_color)
+      stddraw.setFontFamily("Arial")
+      stddraw.setFontSize(self.font_size)
+      stddraw.text(self.x + self.width / 2, self.y + self.height / 2, self.text)
+
+# A class for modeling a button as a filled rectangle with a label on it. The
+# region that responds to clicks is the rectangle unless a hit region is given.
+class Button(Label):
+   # A constructor for creating a button with the given colors and text
+   def __init__(self, x, y, width, height, text, color, text_color, font_size=25,
+                hit_region=None):
+      Label.__init__(self, x, y, width, height, text, text_color, font_size)
+      self.color = color
+      self.hit_region = hit_region
+
+   # A method for changing the color of the button (it is drawn again only
+   # when the color is changed)
+   def set_color(self, color):
+      if str(color) != str(self.color):
+         self.color = color
+         self.invalidate()
+
+   # A method that returns the region that responds to clicks
+   def get_hit_region(self):
+      if self.hit_region is not None:
+         return self.hit_region
+      return self.get_region()
+
+   # A method for drawing the button
+   def draw(self):
+      stddraw.setPenColor(self.color)
+      stddraw.filledRectangle(self.x, self.y, self.width, self.height)
+      if self.text:
+         Label.draw(self)
+
+# A class for modeling a picture centered on the given point
+class Image(Widget):
+   # A constructor for creating an image widget for the given picture
+   def __init__(self, picture, center_x, center_y):
+      # the size of the picture in the coordinates of the canvas
+      x_min, x_max, y_min, y_max, canvas_width, canvas_height = stddraw.getScale()
+      width = picture.width() * (x_max - x_min) / canvas_width
+      height = picture.height() * (y_max - y_min) / canvas_height
+      Widget.__init__(self, center_x - width / 2, center_y - height / 2, width, height)
+      self.picture = picture
+
+   # A method for drawing the picture
+   def draw(self):
+      stddraw.picture(self.picture, self.x + self.width / 2, self.y + self.height / 2)
+
+# A class for modeling a menu as a retained set of widgets: the widgets are
+# drawn once and then only the widgets that are changed are drawn again, and
+# clicks are matched to the widgets by using a spatial index
+class Menu:
+   # the size of the cells of the spatial index (in the canvas coordinates)
+   index_cell_size = 1
+
+   # A constructor for creating an empty menu with the given background color
+   def __init__(self, background_color):
+      self.background_color = background_color
+      # the widgets in the order they are drawn
+      self.widgets = []
+      # the spatial index that maps each cell to the widgets whose drawn region
+      # or hit region overlaps the cell
+      self.index = {}
+      # the widgets that are changed since the menu is drawn
+      self.changed_widgets = []
+
+   # A method that adds the given widget to the menu and returns the widget
+   def add(self, widget):
+      widget.menu = self
+      self.widgets.append(widget)
+      for region in (widget.get_region(), widget.get_hit_region()):
+         if region is not None:
+            for cell in self.get_cells(region):
+               self.index.setdefault(cell, []).append(widget)
+      return widget
+
+   # A method that returns the cells of the spatial index that the given
+   # region (x, y, width, height) overlaps
+   def get_cells(self, region):
+      x, y, width, height = region
+      size = Menu.index_cell_size
+      cols = range(math.floor(x / size), math.floor((x + width) / size) + 1)
+      rows = range(math.floor(y / size), math.floor((y + height) / size) + 1)
+      return [(col, row) for col in cols for row in rows]
+
+   # A method that marks the given widget to be drawn again by refresh
+   def invalidate(self, widget):
+      if widget not in self.changed_widgets:
+         self.changed_widgets.append(widget)
+
+   # A method for drawing the whole menu and showing it
+   def draw(self):
+      stddraw.clear(self.background_color)
+      for widget in self.widgets:
+         widget.draw()
+      self.changed_widgets = []
+      stddraw.show(0)
+
+   # A method for drawing again only the changed widgets (and the widgets that
+   # overlap them) and showing the changed regions
+   def refresh(self):
+      regions = []
+      for widget in self.changed_widgets:
+         region = widget.get_region()
+         stddraw.setClip(*region)
+         stddraw.clear(self.background_color)
+         for other in self.get_overlapping_widgets(region):
+            other.draw()
+         regions.append(region)
+      stddraw.setClip()  # remove the restriction on the drawing
+      self.changed_widgets = []
+      if regions:
+         stddraw.showRegions(regions)
+
+   # A method that returns the widgets whose drawn regions overlap the given
+   # region in the order they are drawn
+   def get_overlapping_widgets(self, region):
+      x, y, width, height = region
+      candidates = set()
+      for cell in self.get_cells(region):
+         candidates.update(self.index.get(cell, []))
+      overlapping = []
+      for widget in self.widgets:
+         if widget in candidates:
+            other_x, other_y, other_width, other_height = widget.get_region()
+            if other_x < x + width and x < other_x + other_width and \
+               other_y < y + height and y < other_y + other_height:
+               overlapping.append(widget)
+      return overlapping
+
+   # A method that returns the topmost widget whose hit region contains the
+   # point (x, y), or None when there is no such widget
+   def get_widget_at(self, x, y):
+      size = Menu.index_cell_size
+      candidates = self.index.get((math.floor(x / size), math.floor(y / size)), [])
+      for widget in reversed(candidates):
+         if widget.contains(x, y):
+            return widget
+      return None
+
+   # A method that waits (without drawing anything) until a widget of the menu
+   # is clicked and returns the clicked widget
+   def wait_for_click(self):
+      while True:
+         # the changed widgets are drawn before waiting for the next input
+         self.refresh()
+         if stddraw.mousePressed():
+            widget = self.get_widget_at(stddraw.mouseX(), stddraw.mouseY())
+            if widget is not None:
+               return widget
+         # the keys typed on the menus are not used
+         stddraw.clearKeysTyped()
+         stddraw.wait(float('inf'))